@@ -0,0 +1,254 @@
+"""
+Steam responses for parser benchmarks.
+
+Responses are generated with a fixed seed in the layout and size of real ones.
+A recorded response saved as benchmarks/recorded/<name> is used instead of the generated one,
+e.g. recorded/inventory_0.json, recorded/price_history.json, recorded/profile_edit.html.
+"""
+import json
+import random
+from datetime import datetime, timedelta
+from functools import partial
+from html import escape
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+RECORDED = Path(__file__).with_name('recorded')
+
+
+def load(name: str, generate: Callable[[], str]) -> str:
+    recorded = RECORDED / name
+    if recorded.exists():
+        return recorded.read_text(encoding='utf-8')
+    return generate()
+
+
+def _description(rng: random.Random, appid: int, classid: str, instanceid: str) -> Dict[str, Any]:
+    name = f'Item {classid} | Pattern {rng.randint(1, 999)}'
+    return {
+        'appid': str(appid),
+        'classid': classid,
+        'instanceid': instanceid,
+        'icon_url': ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz0123456789_-') for _ in range(120)),
+        'icon_url_large': ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz0123456789_-') for _ in range(120)),
+        'icon_drag_url': '',
+        'name': name,
+        'market_hash_name': f'{name} (Field-Tested)',
+        'market_name': f'{name} (Field-Tested)',
+        'name_color': 'D2D2D2',
+        'background_color': '',
+        'type': 'Mil-Spec Grade Rifle',
+        'tradable': rng.randint(0, 1),
+        'marketable': 1,
+        'commodity': 0,
+        'market_tradable_restriction': '7',
+        'descriptions': [
+            {'type': 'html', 'value': 'Exterior: Field-Tested'},
+            {'type': 'html', 'value': ' '},
+            {'type': 'html', 'value': 'It has been painted with a pattern ' * 3, 'color': '9da1a9'},
+        ],
+        'actions': [
+            {
+                'link': (
+                    f'steam://rungame/{appid}/76561202255233023/'
+                    '+csgo_econ_action_preview%20S%owner_steamid%A%assetid%D1'
+                ),
+                'name': 'Inspect in Game...',
+            },
+        ],
+        'tags': [
+            {'internal_name': 'CSGO_Type_Rifle', 'name': 'Rifle', 'category': 'Type', 'category_name': 'Type'},
+            {'internal_name': 'normal', 'name': 'Normal', 'category': 'Quality', 'category_name': 'Category'},
+            {'internal_name': 'Rarity_Rare', 'name': 'Mil-Spec', 'category': 'Rarity', 'category_name': 'Quality'},
+        ],
+    }
+
+
+def inventory_pages(items: int = 5000, classes: int = 1000, page_size: int = 2000, seed: int = 1) -> List[str]:
+    """
+    Pages of the legacy /inventory/json/ endpoint.
+    """
+    rng = random.Random(seed)
+    appid = 730
+    kinds = [(str(rng.randint(10 ** 9, 6 * 10 ** 9)), str(rng.choice([0, 0, 0, 188530139]))) for _ in range(classes)]
+    pages: List[str] = []
+    for start in range(0, items, page_size):
+        inventory: Dict[str, Dict] = {}
+        descriptions: Dict[str, Dict] = {}
+        for position in range(start, min(start + page_size, items)):
+            classid, instanceid = rng.choice(kinds)
+            assetid = str(20000000000 + position * 7)
+            inventory[assetid] = {
+                'id': assetid,
+                'classid': classid,
+                'instanceid': instanceid,
+                'amount': '1',
+                'hide_in_china': 0,
+                'pos': position + 1,
+            }
+            key = f'{classid}_{instanceid}'
+            if key not in descriptions:
+                descriptions[key] = _description(rng, appid, classid, instanceid)
+        page: Dict[str, Any] = {
+            'success': True,
+            'rgInventory': inventory,
+            'rgCurrency': [],
+            'rgDescriptions': descriptions,
+            'more': start + page_size < items,
+            'more_start': start + page_size if start + page_size < items else False,
+        }
+        pages.append(load(f'inventory_{len(pages)}.json', partial(json.dumps, page)))
+    return pages
+
+
+def price_history(points: int = 4000, seed: int = 2) -> str:
+    """
+    /market/pricehistory/ response, daily points followed by hourly points of the last month.
+    """
+
+    def generate() -> str:
+        rng = random.Random(seed)
+        hourly = min(points, 24 * 30)
+        start = datetime(2024, 6, 1) - timedelta(days=points - hourly)
+        prices = []
+        price = 12.5
+        for index in range(points):
+            if index < points - hourly:
+                sale = start + timedelta(days=index)
+            else:
+                sale = datetime(2024, 6, 1) + timedelta(hours=index - (points - hourly))
+            price = max(0.03, round(price * rng.uniform(0.97, 1.03), 3))
+            prices.append([sale.strftime('%b %d %Y %H: +0'), price, str(rng.randint(1, 900))])
+        return json.dumps({
+            'success': True,
+            'price_prefix': '',
+            'price_suffix': ' pуб.',
+            'prices': prices,
+        })
+
+    return load('price_history.json', generate)
+
+
+def mobile_confirmations(count: int = 100, seed: int = 3) -> str:
+    """
+    /mobileconf/getlist response.
+    """
+
+    def generate() -> str:
+        rng = random.Random(seed)
+        confirmations = []
+        for _ in range(count):
+            confirmations.append({
+                'type': 2,
+                'type_name': 'Trade Offer',
+                'id': str(rng.randint(10 ** 10, 10 ** 11)),
+                'creator_id': str(rng.randint(5 * 10 ** 9, 7 * 10 ** 9)),
+                'nonce': str(rng.randint(10 ** 18, 10 ** 19)),
+                'creation_time': 1717200000 + rng.randint(0, 86400),
+                'cancel': 'Cancel',
+                'accept': 'Send Offer',
+                'icon': 'https://avatars.akamai.steamstatic.com/' + '%040x' % rng.getrandbits(160) + '_full.jpg',
+                'multi': False,
+                'headline': f'Trade with user{rng.randint(1, 99999)}',
+                'summary': ['You will give up 3 items', 'You will receive 1 item'],
+                'warn': None,
+            })
+        return json.dumps({'success': True, 'conf': confirmations})
+
+    return load('mobile_confirmations.json', generate)
+
+
+def _filler(rng: random.Random, size: int) -> str:
+    """
+    Markup of page header, menus and scripts before the interesting part of the page.
+    """
+    parts = []
+    length = 0
+    while length < size:
+        number = rng.randint(1, 10 ** 6)
+        block = (
+            f'<div class="responsive_menu_item menu_{number}" data-tooltip-html="Menu &quot;{number}&quot;">'
+            f'<a class="menuitem supernav" href="https://steamcommunity.com/app/{number}/" '
+            f'data-tooltip-content=".submenu_{number}">Section {number}</a>'
+            f'<img src="https://community.akamai.steamstatic.com/public/images/{number}.png" alt="">'
+            f'<span class="count">{number % 97}</span></div>\n'
+        )
+        if number % 5 == 0:
+            block += f'<script>g_rgData[{number}] = {{"id": {number}, "value": "<b>x</b>"}};</script>\n'
+        parts.append(block)
+        length += len(block)
+    return ''.join(parts)
+
+
+def profile_edit_page(size: int = 150000, seed: int = 4) -> str:
+    """
+    /profiles/<steamid>/edit/info page with data-profile-edit config.
+    """
+
+    def generate() -> str:
+        rng = random.Random(seed)
+        config = {
+            'strPersonaName': 'persona & "name"',
+            'strRealName': 'Real Name',
+            'strCustomURL': 'custom',
+            'strSummary': 'Summary <b>with</b> markup ' * 20,
+            'LocationData': {
+                'locCountry': 'US', 'locCountryCode': 'US', 'locState': 'WA', 'locStateCode': '48',
+                'locCity': 'Seattle', 'locCityCode': 3961,
+            },
+            'ProfilePreferences': {'hide_profile_awards': 0},
+            'Privacy': {
+                'PrivacySettings': {
+                    'PrivacyProfile': 3, 'PrivacyInventory': 3, 'PrivacyInventoryGifts': 1,
+                    'PrivacyOwnedGames': 3, 'PrivacyPlaytime': 3, 'PrivacyFriendsList': 3,
+                },
+                'eCommentPermission': 1,
+            },
+            'rgAvatarHistory': [
+                {'avatar_hash': '%040x' % rng.getrandbits(160), 'timestamp': 1600000000 + index}
+                for index in range(40)
+            ],
+        }
+        return ''.join([
+            '<!DOCTYPE html>\n<html class="responsive" lang="en">\n',
+            '<head><title>Steam Community :: Edit Profile</title>',
+            '</head>\n<body class="flat_page responsive_page">\n',
+            _filler(rng, size),
+            '<div class="profile_edit_config" id="profile_edit_config" ',
+            f'data-profile-edit="{escape(json.dumps(config))}" data-profile-badges="[]"></div>\n',
+            _filler(rng, size // 4),
+            '</body>\n</html>\n',
+        ])
+
+    return load('profile_edit.html', generate)
+
+
+def store_page(size: int = 400000, seed: int = 5) -> str:
+    """
+    store.steampowered.com/app/<appid>/ page with add to cart forms.
+    """
+
+    def generate() -> str:
+        rng = random.Random(seed)
+        forms = []
+        for subid in (469, 54029, 330198):
+            forms.append(
+                f'<div class="game_area_purchase_game"><form name="add_to_cart_{subid}" '
+                f'action="https://store.steampowered.com/cart/" method="POST">\n'
+                f'<input type="hidden" name="snr" value="1_5_9__403">\n'
+                f'<input type="hidden" name="originating_snr" value="1_store-navigation__">\n'
+                f'<input type="hidden" name="action" value="add_to_cart">\n'
+                f'<input type="hidden" name="sessionid" value="{"%024x" % rng.getrandbits(96)}">\n'
+                f'<input type="hidden" name="subid" value="{subid}">\n'
+                f'</form><div class="game_purchase_action">Add to Cart</div></div>\n'
+            )
+        return ''.join([
+            '<!DOCTYPE html>\n<html class="responsive" lang="en">\n<head><title>Counter-Strike on Steam</title>',
+            '</head>\n<body class="v6 app game_bg responsive_page">\n',
+            _filler(rng, size // 2),
+            *forms,
+            _filler(rng, size // 2),
+            '</body>\n</html>\n',
+        ])
+
+    return load('store_page.html', generate)
@@ -0,0 +1,108 @@
+"""
+Import time of steamlib modules.
+
+Every module is imported in a fresh interpreter with -X importtime after pysteamauth.auth,
+which is imported by the application anyway to create Steam. The run fails if a module
+imports a module that has to be loaded lazily. Median of the runs is compared with import_time.json,
+record the baseline with --save on the machine that runs the comparison. With --check the run
+also fails if a module became slower than the baseline allows.
+
+    python benchmarks/import_time.py --save
+    python benchmarks/import_time.py --check
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+BASELINE = Path(__file__).with_name('import_time.json')
+PRELOAD = 'pysteamauth.auth'
+TARGETS: Dict[str, List[str]] = {
+    'steamlib.api': [
+        'lxml',
+        'steamlib.api.account',
+        'steamlib.api.inventory',
+        'steamlib.api.market',
+        'steamlib.api.store',
+        'steamlib.api.trade',
+        'steamlib.transport',
+    ],
+    'steamlib.api.account': ['lxml'],
+    'steamlib.api.inventory': ['lxml', 'pydantic'],
+    'steamlib.api.market': ['lxml'],
+    'steamlib.api.store': ['lxml'],
+    'steamlib.api.trade': ['lxml'],
+}
+
+
+def import_time(module: str) -> float:
+    """
+    Milliseconds spent on `import module` after the preloaded modules.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {PRELOAD}; import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    preloaded = False
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or line.endswith('| package'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name[1:] != name.strip():
+            continue
+        if preloaded:
+            total += int(cumulative)
+        elif name.strip() == PRELOAD:
+            preloaded = True
+    return total / 1000
+
+
+def imported(module: str, names: List[str]) -> List[str]:
+    code = (
+        f'import sys, {module}; '
+        f'print(*[name for name in {names!r} if name in sys.modules])'
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--tolerance', type=float, default=1.5, help='Allowed slowdown relative to the baseline')
+    parser.add_argument('--slack', type=float, default=5, help='Allowed slowdown in milliseconds')
+    parser.add_argument('--save', action='store_true', help='Write measured times as the new baseline')
+    parser.add_argument('--check', action='store_true', help='Fail if a module is slower than the baseline')
+    args = parser.parse_args()
+
+    baseline: Dict[str, float] = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    measured: Dict[str, float] = {}
+    failed = False
+    print(f'{"module":<26}{"median ms":>12}{"baseline ms":>14}')
+    for module, lazy in TARGETS.items():
+        measured[module] = statistics.median(import_time(module) for _ in range(args.runs))
+        expected = baseline.get(module)
+        status = ''
+        if expected is not None and measured[module] > expected * args.tolerance + args.slack:
+            status = 'SLOWER'
+            failed = failed or args.check
+        loaded = imported(module, lazy)
+        if loaded:
+            status = f'imports {", ".join(loaded)}'
+            failed = True
+        print(f'{module:<26}{measured[module]:>12.1f}{expected if expected is not None else "-":>14}  {status}')
+
+    if args.save:
+        BASELINE.write_text(json.dumps({module: round(ms, 1) for module, ms in measured.items()}, indent=4) + '\n')
+        return 0
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Parser benchmarks on offline Steam responses.
+
+Every case calls library code with a Steam replaying responses from fixtures.py,
+so no network and no account are needed. Time is the best of the repeats per operation,
+memory is the tracemalloc peak of one operation, allocations made by lxml are not traced.
+Results are compared with parsers.json. Timings depend on the machine, so record the baseline
+with --save on the machine that runs the comparison. With --check the run fails if a case
+became slower or needs more memory than the baseline allows.
+
+    python benchmarks/parsers.py --save
+    python benchmarks/parsers.py --check
+    python benchmarks/parsers.py --case price_history --case price_history_trusted
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import fixtures
+from lxml.html import document_fromstring
+
+from steamlib import codec
+from steamlib.api.account.api import SteamAccount
+from steamlib.api.inventory.api import SteamInventory
+from steamlib.api.market.schemas import PriceHistoryColumnsResponse, PriceHistoryResponse
+from steamlib.api.store.purchase.api import PurchaseGame
+from steamlib.api.trade.schemas import GetMobileConfirmationResponse
+from steamlib.extract import attribute_by_id, input_value
+from steamlib.schemas import SteamModel
+
+BASELINE = Path(__file__).with_name('parsers.json')
+Operation = Callable[[], Any]
+
+
+class ReplaySteam:
+    """
+    Steam returning fixture responses by url.
+    """
+
+    steamid = 76561198000000000
+    partner_id = 39734272
+
+    def __init__(self, responses: Dict[str, Callable[[Dict], str]]):
+        self.responses = responses
+
+    async def request(self, url: str, method: str = 'GET', **kwargs: Any) -> str:  # noqa:U100
+        for part, response in self.responses.items():
+            if part in url:
+                return response(kwargs.get('params') or {})
+        raise LookupError(url)
+
+    async def sessionid(self, domain: str = 'steamcommunity.com') -> str:  # noqa:U100
+        return '0123456789abcdef01234567'
+
+
+def run(coroutine: Callable[[], Any]) -> Operation:
+    loop = asyncio.new_event_loop()
+    return lambda: loop.run_until_complete(coroutine())
+
+
+def trusted(model: type, operation: Operation) -> Operation:
+    def call() -> Any:
+        model.trusted = True  # type:ignore
+        try:
+            return operation()
+        finally:
+            del model.trusted  # type:ignore
+
+    return call
+
+
+def inventory() -> SteamInventory:
+    pages = fixtures.inventory_pages()
+    steam = ReplaySteam({'/inventory/json/': lambda params: pages[params['start'] // 2000]})
+    return SteamInventory(steam)  # type:ignore
+
+
+def inventory_merge() -> Operation:
+    client = inventory()
+    return run(lambda: client.get_inventory('730', 2))
+
+
+def inventory_items() -> Operation:
+    client = inventory()
+    return run(lambda: client.get_items('730', 2))
+
+
+def price_history() -> Operation:
+    raw = fixtures.price_history()
+    return lambda: PriceHistoryResponse.parse_raw(raw)
+
+
+def price_history_trusted() -> Operation:
+    return trusted(PriceHistoryResponse, price_history())
+
+
+def price_history_columns() -> Operation:
+    raw = fixtures.price_history()
+    return lambda: PriceHistoryColumnsResponse.parse_raw(raw)
+
+
+def mobile_confirmations() -> Operation:
+    raw = fixtures.mobile_confirmations()
+    return lambda: GetMobileConfirmationResponse.parse_raw(raw)
+
+
+def mobile_confirmations_trusted() -> Operation:
+    return trusted(GetMobileConfirmationResponse, mobile_confirmations())
+
+
+def profile_edit_page() -> Operation:
+    page = fixtures.profile_edit_page()
+    config = document_fromstring(page).get_element_by_id('profile_edit_config').attrib['data-profile-edit']
+    assert attribute_by_id(page, 'profile_edit_config', 'data-profile-edit') == config
+    account = SteamAccount(ReplaySteam({'/edit/info': lambda params: page}))  # type:ignore  # noqa:U100
+
+    async def call() -> Any:
+        account.invalidate_profile_config()
+        return await account.get_current_profile_info()
+
+    return run(call)
+
+
+def profile_edit_page_lxml() -> Operation:
+    page = fixtures.profile_edit_page()
+    return lambda: codec.loads(
+        document_fromstring(page).get_element_by_id('profile_edit_config').attrib['data-profile-edit'],
+    )
+
+
+def store_page() -> Operation:
+    page = fixtures.store_page()
+    document = document_fromstring(page)
+    for name in ('snr', 'originating_snr', 'action', 'subid'):
+        assert input_value(page, name) == document.cssselect(f'input[name="{name}"]')[0].attrib['value']
+    purchase = PurchaseGame(ReplaySteam({'store.steampowered.com/app/': lambda params: page}), '730')  # type:ignore
+
+    async def call() -> Any:
+        PurchaseGame._cart_data.clear()
+        return await purchase.get_data_for_cart()
+
+    return run(call)
+
+
+def store_page_lxml() -> Operation:
+    page = fixtures.store_page()
+
+    def call() -> Dict[str, str]:
+        document = document_fromstring(page)
+        return {
+            name: document.cssselect(f'input[name="{name}"]')[0].attrib['value']
+            for name in ('snr', 'originating_snr', 'action', 'subid')
+        }
+
+    return call
+
+
+CASES: Dict[str, Callable[[], Operation]] = {
+    'inventory_merge': inventory_merge,
+    'inventory_items': inventory_items,
+    'price_history': price_history,
+    'price_history_trusted': price_history_trusted,
+    'price_history_columns': price_history_columns,
+    'mobile_confirmations': mobile_confirmations,
+    'mobile_confirmations_trusted': mobile_confirmations_trusted,
+    'profile_edit_page': profile_edit_page,
+    'profile_edit_page_lxml': profile_edit_page_lxml,
+    'store_page': store_page,
+    'store_page_lxml': store_page_lxml,
+}
+
+
+def measure(operation: Operation, repeat: int, min_time: float) -> Tuple[float, float]:
+    """
+    Milliseconds and peak KiB per operation.
+    """
+    operation()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    timings = [elapsed]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        operation()
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return min(timings) / number * 1000, peak / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--case', action='append', choices=sorted(CASES), help='Run only these cases')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='Seconds of one repeat')
+    parser.add_argument('--tolerance', type=float, default=1.3, help='Allowed slowdown relative to the baseline')
+    parser.add_argument('--memory-tolerance', type=float, default=1.1, help='Allowed memory growth')
+    parser.add_argument('--save', action='store_true', help='Write measured results as the new baseline')
+    parser.add_argument('--check', action='store_true', help='Fail if a case is worse than the baseline')
+    args = parser.parse_args()
+
+    SteamModel.trusted = False
+    baseline: Dict[str, Dict[str, float]] = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    results: Dict[str, Dict[str, float]] = {}
+    failed: List[str] = []
+    print(f'{"case":<30}{"ms/op":>10}{"baseline":>10}{"peak KiB":>12}{"baseline":>10}')
+    for name in args.case or CASES:
+        milliseconds, kibibytes = measure(CASES[name](), args.repeat, args.min_time)
+        results[name] = {'ms': round(milliseconds, 3), 'kib': round(kibibytes, 1)}
+        expected = baseline.get(name)
+        status = ''
+        if expected is not None:
+            if milliseconds > expected['ms'] * args.tolerance:
+                status = 'SLOWER'
+            elif kibibytes > expected['kib'] * args.memory_tolerance:
+                status = 'MORE MEMORY'
+        if status:
+            failed.append(name)
+        print(
+            f'{name:<30}{milliseconds:>10.3f}{expected["ms"] if expected else "-":>10}'
+            f'{kibibytes:>12.1f}{expected["kib"] if expected else "-":>10}  {status}',
+        )
+
+    if args.save:
+        BASELINE.write_text(json.dumps({**baseline, **results}, indent=4) + '\n')
+        return 0
+    return 1 if failed and args.check else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
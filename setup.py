@@ -3,7 +3,6 @@ from setuptools import setup
 
 requirements = [
     'pysteamauth==1.1.0',
-    'aiofiles==22.1.0',
     'cssselect==1.1.0',
     'lxml==5.3.0',
 ]
@@ -22,6 +21,9 @@ setup(
     zip_safe=False,
     python_requires='>=3.9',
     install_requires=requirements,
+    extras_require={
+        'orjson': ['orjson>=3.8'],
+    },
     setup_requires=requirements,
     include_package_data=True,
 )
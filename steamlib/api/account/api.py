@@ -1,17 +1,24 @@
-import json
-from typing import List
+import asyncio
+import time
+from os import PathLike
+from typing import TYPE_CHECKING, AsyncIterable, BinaryIO, Dict, List, Optional, Union
 
-import aiofiles
 from aiohttp import FormData
-from lxml.html import HtmlElement, document_fromstring
-from pysteamauth.auth import Steam
 from yarl import URL
 
+from steamlib import codec
 from steamlib.api.enums import Language
+from steamlib.extract import attribute_by_id, child_text, parse_document
 
 from .exceptions import KeyRegistrationError, ProfileError
 from .schemas import AvatarResponse, NicknameHistory, PrivacyInfo, PrivacyResponse, ProfileInfo, ProfileInfoResponse
 
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+    from pysteamauth.auth import Steam
+
+AvatarSource = Union[str, PathLike, bytes, BinaryIO, AsyncIterable[bytes]]
+
 
 class SteamAccount:
 
@@ -20,13 +27,17 @@ class SteamAccount:
         'You will be granted access to Steam Web API keys when you have games in your Steam account.',
     ]
 
-    def __init__(self, steam: Steam):
+    def __init__(self, steam: 'Steam', profile_config_ttl: float = 60):
         self.steam = steam
+        self.profile_config_ttl = profile_config_ttl
+        self._profile_config: Optional[Dict] = None
+        self._profile_config_expires = 0.0
+        self._profile_config_lock: Optional[asyncio.Lock] = None
 
     def _check_profile_error(self, response: str) -> None:
         if 'class="profile_fatalerror_message"' in response:
-            page: HtmlElement = document_fromstring(response)
-            tag: List[HtmlElement] = page.cssselect('.profile_fatalerror .profile_fatalerror_message')
+            page = parse_document(response)
+            tag: List['HtmlElement'] = page.cssselect('.profile_fatalerror .profile_fatalerror_message')
             message = 'Profile error'
             if tag:
                 message = tag[0].text
@@ -47,6 +58,28 @@ class SteamAccount:
         self._check_profile_error(response)
         return response
 
+    def invalidate_profile_config(self) -> None:
+        self._profile_config = None
+
+    async def _get_profile_config(self) -> Dict:
+        """
+        Parsed data-profile-edit config of profile editing page.
+        It is cached for profile_config_ttl seconds and reset by profile changes.
+        """
+        config = self._profile_config
+        if config is not None and time.monotonic() < self._profile_config_expires:
+            return config
+        if self._profile_config_lock is None:
+            self._profile_config_lock = asyncio.Lock()
+        async with self._profile_config_lock:
+            config = self._profile_config
+            if config is None or time.monotonic() >= self._profile_config_expires:
+                response: str = await self._get_profile_editing_page()
+                info: Dict = codec.loads(attribute_by_id(response, 'profile_edit_config', 'data-profile-edit'))
+                self._profile_config = config = info
+                self._profile_config_expires = time.monotonic() + self.profile_config_ttl
+        return config
+
     async def get_nickname_history(self) -> NicknameHistory:
         response: str = await self.steam.request(
             method='POST',
@@ -82,9 +115,7 @@ class SteamAccount:
         return True if response == 'true' else False
 
     async def get_current_profile_info(self) -> ProfileInfo:
-        response: str = await self._get_profile_editing_page()
-        page: HtmlElement = document_fromstring(response)
-        info = json.loads(page.cssselect('#profile_edit_config')[0].attrib['data-profile-edit'])
+        info = await self._get_profile_config()
         return ProfileInfo(
             personaName=info['strPersonaName'],
             real_name=info['strRealName'],
@@ -118,12 +149,11 @@ class SteamAccount:
             },
             raise_for_status=True,
         )
+        self.invalidate_profile_config()
         return ProfileInfoResponse.parse_raw(response)
 
     async def get_current_privacy(self) -> PrivacyInfo:
-        response: str = await self._get_profile_editing_page()
-        page: HtmlElement = document_fromstring(response)
-        info = json.loads(page.cssselect('#profile_edit_config')[0].attrib['data-profile-edit'])
+        info = await self._get_profile_config()
         return PrivacyInfo(**info['Privacy'])
 
     async def set_privacy(self, settings: PrivacyInfo) -> PrivacyResponse:
@@ -145,6 +175,7 @@ class SteamAccount:
             },
             raise_for_status=True,
         )
+        self.invalidate_profile_config()
         return PrivacyResponse.parse_raw(response)
 
     async def revoke_api_key(self) -> None:
@@ -189,8 +220,7 @@ class SteamAccount:
             if error in response:
                 raise KeyRegistrationError(error)
 
-        page: HtmlElement = document_fromstring(response)
-        key = page.cssselect('#bodyContents_ex > p:nth-child(2)')[0].text
+        key = child_text(response, 'bodyContents_ex', 'p', 2)
         return key[key.index(' ') + 1:]
 
     async def register_tradelink(self) -> str:
@@ -217,22 +247,31 @@ class SteamAccount:
         }
         return str(URL('https://steamcommunity.com/tradeoffer/new/').with_query(params))
 
-    async def upload_avatar(self, path_to_avatar: str) -> AvatarResponse:
-        async with aiofiles.open(path_to_avatar, mode='rb') as file:
-            image = await file.read()
+    async def upload_avatar(self, path_to_avatar: AvatarSource) -> AvatarResponse:
+        """
+        :param path_to_avatar: Path to image, binary file object, image bytes or async iterator of bytes.
+            Files and iterators are streamed without reading the whole image into memory,
+            the same bytes object can be uploaded to many accounts.
+        """
+        if isinstance(path_to_avatar, (str, PathLike)):
+            with open(path_to_avatar, mode='rb') as file:
+                return await self._upload_avatar(file)
+        return await self._upload_avatar(path_to_avatar)
+
+    async def _upload_avatar(self, image: Union[bytes, BinaryIO, AsyncIterable[bytes]]) -> AvatarResponse:
+        data = FormData()
+        data.add_field('avatar', image, filename='avatar')
+        data.add_fields(
+            ('type', 'player_avatar_image'),
+            ('sId', str(self.steam.steamid)),
+            ('sessionid', await self.steam.sessionid()),
+            ('doSub', '1'),
+            ('json', '1'),
+        )
         response: str = await self.steam.request(
             method='POST',
             url='https://steamcommunity.com/actions/FileUploader/',
-            data=FormData(
-                fields=[
-                    ('avatar', image),
-                    ('type', 'player_avatar_image'),
-                    ('sId', str(self.steam.steamid)),
-                    ('sessionid', await self.steam.sessionid()),
-                    ('doSub', '1'),
-                    ('json', '1'),
-                ],
-            ),
+            data=data,
             headers={
                 'Origin': 'https://steamcommunity.com',
                 'Referer': f'https://steamcommunity.com/profiles/{self.steam.steamid}/edit/avatar',
@@ -240,6 +279,7 @@ class SteamAccount:
             },
             raise_for_status=True,
         )
+        self.invalidate_profile_config()
         return AvatarResponse.parse_raw(response)
 
     async def get_tradelink(self) -> str:
@@ -255,5 +295,4 @@ class SteamAccount:
             raise_for_status=True,
         )
 
-        page: HtmlElement = document_fromstring(response)
-        return page.get_element_by_id('trade_offer_access_url').value
+        return attribute_by_id(response, 'trade_offer_access_url', 'value')
@@ -3,7 +3,7 @@ from typing import Generator, List, Optional
 from pydantic import BaseModel, Field
 
 from steamlib.api.account.enums import CommentPermissionLevel, PrivacyLevel
-from steamlib.schemas import BaseSteamResponse
+from steamlib.schemas import BaseSteamResponse, SteamModel
 
 
 class PrivacySettings(BaseModel):
@@ -50,7 +50,7 @@ class Images(BaseModel):
         }
 
 
-class AvatarResponse(BaseModel):
+class AvatarResponse(SteamModel):
     success: bool
     images: Images
     avatar_hash: str = Field(alias='hash')
@@ -62,7 +62,7 @@ class Nickname(BaseModel):
     timechanged: str
 
 
-class NicknameHistory(BaseModel):
+class NicknameHistory(SteamModel):
     __root__: List[Nickname]
 
     def __iter__(self) -> Generator[Nickname, None, None]:  # type:ignore
@@ -1,37 +1,88 @@
-from pysteamauth.auth import Steam
+from types import TracebackType
+from typing import TYPE_CHECKING, Optional, Type
 
-from steamlib.api.account.api import SteamAccount
-from steamlib.api.inventory.api import SteamInventory
-from steamlib.api.market.api import SteamMarket
-from steamlib.api.store.api import SteamStore
-from steamlib.api.trade.api import SteamTrade
+from steamlib.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from pysteamauth.auth import Steam
+
+    from steamlib.api.account.api import SteamAccount
+    from steamlib.api.inventory.api import SteamInventory
+    from steamlib.api.market.api import SteamMarket
+    from steamlib.api.store.api import SteamStore
+    from steamlib.api.trade.api import SteamTrade
+    from steamlib.transport import SteamTransport
 
 
 class SteamAPI:
+    """
+    Clients are created on first access, modules of unused clients are not imported.
+    """
+
+    def __init__(self, steam: 'Steam', transport: Optional['SteamTransport'] = None, coalesce: bool = False):
+        """
+        :param transport: Request strategy passed to Steam, it is closed together with SteamAPI.
+            ValueError is raised when steam uses another request strategy.
+        :param coalesce: Share result of identical read requests made at the same time
+            (inventories, price history, market availability, trade offers).
+        """
+        if transport is not None and getattr(steam, '_requests', None) is not transport:
+            raise ValueError('Transport is not the request strategy of steam')
+        self.steam = steam
+        self.transport = transport
+        self.single_flight = SingleFlight() if coalesce else None
+        self._account: Optional['SteamAccount'] = None
+        self._inventory: Optional['SteamInventory'] = None
+        self._market: Optional['SteamMarket'] = None
+        self._store: Optional['SteamStore'] = None
+        self._trade: Optional['SteamTrade'] = None
+
+    async def close(self) -> None:
+        if self.transport is not None:
+            await self.transport.close()
+
+    async def __aenter__(self) -> 'SteamAPI':
+        return self
 
-    def __init__(self, steam: Steam):
-        self._account = SteamAccount(steam)
-        self._inventory = SteamInventory(steam)
-        self._market = SteamMarket(steam)
-        self._store = SteamStore(steam)
-        self._trade = SteamTrade(steam)
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],  # noqa:U100
+        exc_val: Optional[BaseException],  # noqa:U100
+        exc_tb: Optional[TracebackType],  # noqa:U100
+    ) -> None:
+        await self.close()
 
     @property
-    def account(self) -> SteamAccount:
+    def account(self) -> 'SteamAccount':
+        if self._account is None:
+            from steamlib.api.account.api import SteamAccount
+            self._account = SteamAccount(self.steam)
         return self._account
 
     @property
-    def inventory(self) -> SteamInventory:
+    def inventory(self) -> 'SteamInventory':
+        if self._inventory is None:
+            from steamlib.api.inventory.api import SteamInventory
+            self._inventory = SteamInventory(self.steam, self.single_flight)
         return self._inventory
 
     @property
-    def market(self) -> SteamMarket:
+    def market(self) -> 'SteamMarket':
+        if self._market is None:
+            from steamlib.api.market.api import SteamMarket
+            self._market = SteamMarket(self.steam, self.single_flight)
         return self._market
 
     @property
-    def store(self) -> SteamStore:
+    def store(self) -> 'SteamStore':
+        if self._store is None:
+            from steamlib.api.store.api import SteamStore
+            self._store = SteamStore(self.steam)
         return self._store
 
     @property
-    def trade(self) -> SteamTrade:
+    def trade(self) -> 'SteamTrade':
+        if self._trade is None:
+            from steamlib.api.trade.api import SteamTrade
+            self._trade = SteamTrade(self.steam, self.single_flight)
         return self._trade
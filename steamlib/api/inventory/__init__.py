@@ -1,5 +1,14 @@
 from .api import SteamInventory
+from .enums import InventoryBackend
+from .schemas import Inventory, InventoryDescription, InventoryDiff, InventoryItem
+from .snapshot import InventorySnapshot
 
 __all__ = [
     'SteamInventory',
+    'InventoryBackend',
+    'Inventory',
+    'InventoryDescription',
+    'InventoryDiff',
+    'InventoryItem',
+    'InventorySnapshot',
 ]
@@ -1,17 +1,25 @@
-import json
-from typing import Dict
+import asyncio
+from typing import TYPE_CHECKING, AsyncGenerator, Dict, Iterable, List, Optional, Tuple, Union
 
-from pysteamauth.auth import Steam
+from aiohttp import ClientResponseError
 
+from steamlib import codec
 from steamlib.api.enums import Language
+from steamlib.singleflight import SingleFlight, coalesce
 
+from .enums import InventoryBackend
 from .exceptions import NullInventoryError, PrivateInventoryError, UnknownInventoryError
+from .schemas import Inventory
+
+if TYPE_CHECKING:
+    from pysteamauth.auth import Steam
 
 
 class SteamInventory:
 
-    def __init__(self, steam: Steam):
+    def __init__(self, steam: 'Steam', single_flight: Optional[SingleFlight] = None):
         self.steam = steam
+        self.single_flight = single_flight
 
     async def _inventory(self, appid: str, contextid: int, start: int, language: Language) -> Dict:
         response: str = await self.steam.request(
@@ -28,26 +36,181 @@ class SteamInventory:
         )
         if response == 'null':
             raise NullInventoryError(steamid=self.steam.steamid, appid=appid)
-        return json.loads(response)
+        return codec.loads(response)
 
-    async def get_inventory(self, appid: str, contextid: int, language: Language = Language.english) -> Dict:
-        inventory: Dict = {
-            'rgInventory': {},
-            'rgDescriptions': {},
+    async def _inventory_cursor(
+        self,
+        appid: str,
+        contextid: int,
+        start_assetid: Optional[str],
+        count: int,
+        language: Language,
+    ) -> Dict:
+        params = {
+            'l': language.value,
+            'count': count,
         }
+        if start_assetid is not None:
+            params['start_assetid'] = start_assetid
+        try:
+            response: str = await self.steam.request(
+                url=f'https://steamcommunity.com/inventory/{self.steam.steamid}/{appid}/{contextid}',
+                params=params,
+                headers={
+                    'Content-Type': 'application/json',
+                    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:1.9.5.20) Gecko/2812-12-10 04:56:28 Firefox/3.8',
+                },
+                raise_for_status=True,
+            )
+        except ClientResponseError as error:
+            if error.status == 403:
+                raise PrivateInventoryError(steamid=self.steam.steamid, appid=appid) from error
+            raise
+        data = codec.loads(response)
+        if data is None:
+            raise NullInventoryError(steamid=self.steam.steamid, appid=appid)
+        return data
+
+    def _check_inventory_error(self, response: Dict, appid: str) -> None:
+        if not response['success']:
+            error = response.get('Error', '')
+            if not error:
+                raise UnknownInventoryError(steamid=self.steam.steamid, appid=appid)
+            if error == 'This profile is private.':
+                raise PrivateInventoryError(steamid=self.steam.steamid, appid=appid)
+
+    async def _legacy_pages(self, appid: str, contextid: int, language: Language) -> AsyncGenerator[Dict, None]:
         start = 0
         while True:
             response = await self._inventory(appid, contextid, start, language)
-            if not response['success']:
-                error = response.get('Error', '')
-                if not error:
-                    raise UnknownInventoryError(steamid=self.steam.steamid, appid=appid)
-                if error == 'This profile is private.':
-                    raise PrivateInventoryError(steamid=self.steam.steamid, appid=appid)
-            inventory['rgInventory'].update(response['rgInventory'])
-            inventory['rgDescriptions'].update(response['rgDescriptions'])
+            self._check_inventory_error(response, appid)
+            yield response
             if response.get('more'):
                 start = response['more_start']
             else:
                 break
+
+    async def _cursor_pages(
+        self,
+        appid: str,
+        contextid: int,
+        count: int,
+        language: Language,
+    ) -> AsyncGenerator[Dict, None]:
+        """
+        Pages of /inventory/ endpoint converted to the legacy page layout,
+        every asset carries id like assets of legacy pages.
+        """
+        start_assetid: Optional[str] = None
+        while True:
+            response = await self._inventory_cursor(appid, contextid, start_assetid, count, language)
+            self._check_inventory_error(response, appid)
+            yield {
+                'success': response['success'],
+                'rgInventory': {
+                    asset['assetid']: {**asset, 'id': asset['assetid']} for asset in response.get('assets', [])
+                },
+                'rgDescriptions': {
+                    f'{description["classid"]}_{description["instanceid"]}': description
+                    for description in response.get('descriptions', [])
+                },
+            }
+            if response.get('more_items'):
+                start_assetid = response['last_assetid']
+            else:
+                break
+
+    def _pages(
+        self,
+        appid: str,
+        contextid: int,
+        language: Language,
+        backend: InventoryBackend,
+        count: int,
+    ) -> AsyncGenerator[Dict, None]:
+        if backend is InventoryBackend.cursor:
+            return self._cursor_pages(appid, contextid, count, language)
+        return self._legacy_pages(appid, contextid, language)
+
+    async def iter_inventory(
+        self,
+        appid: str,
+        contextid: int,
+        language: Language = Language.english,
+        backend: InventoryBackend = InventoryBackend.legacy,
+        count: int = 2000,
+    ) -> AsyncGenerator[Tuple[Dict, Dict], None]:
+        """
+        Yield (asset, description) pairs page by page.
+        Only the current page is kept in memory.
+        """
+        async for page in self._pages(appid, contextid, language, backend, count):
+            descriptions: Dict = page['rgDescriptions'] or {}
+            for asset in (page['rgInventory'] or {}).values():
+                yield asset, descriptions[f'{asset["classid"]}_{asset["instanceid"]}']
+
+    @coalesce
+    async def get_inventory(
+        self,
+        appid: str,
+        contextid: int,
+        language: Language = Language.english,
+        backend: InventoryBackend = InventoryBackend.legacy,
+        count: int = 2000,
+    ) -> Dict:
+        """
+        :param backend: Legacy endpoint pages by offset,
+            cursor endpoint pages by last_assetid and returns up to count items per page.
+        :param count: Page size, used only by cursor backend.
+        """
+        inventory: Dict = {
+            'rgInventory': {},
+            'rgDescriptions': {},
+        }
+        async for page in self._pages(appid, contextid, language, backend, count):
+            inventory['rgInventory'].update(page['rgInventory'])
+            inventory['rgDescriptions'].update(page['rgDescriptions'])
+        return inventory
+
+    async def get_inventories(
+        self,
+        pairs: Iterable[Tuple[str, int]],
+        language: Language = Language.english,
+        backend: InventoryBackend = InventoryBackend.legacy,
+        count: int = 2000,
+        limit: int = 4,
+    ) -> Dict[Tuple[str, int], Union[Dict, Exception]]:
+        """
+        Fetch inventories of several (appid, contextid) pairs concurrently.
+        A failed pair gets its exception instead of inventory, other pairs are still fetched.
+
+        :param limit: Maximum number of inventories fetched at the same time.
+        :return: Inventory for every pair, or the exception raised for this pair
+            (NullInventoryError, PrivateInventoryError, UnknownInventoryError, request errors).
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def fetch(appid: str, contextid: int) -> Union[Dict, Exception]:
+            async with semaphore:
+                try:
+                    return await self.get_inventory(appid, contextid, language, backend, count)
+                except Exception as error:
+                    return error
+
+        unique: List[Tuple[str, int]] = list(dict.fromkeys(pairs))
+        results = await asyncio.gather(*(fetch(appid, contextid) for appid, contextid in unique))
+        return dict(zip(unique, results))
+
+    @coalesce
+    async def get_items(
+        self,
+        appid: str,
+        contextid: int,
+        language: Language = Language.english,
+        backend: InventoryBackend = InventoryBackend.legacy,
+        count: int = 2000,
+    ) -> Inventory:
+        inventory = Inventory(appid=appid, contextid=contextid)
+        async for asset, description in self.iter_inventory(appid, contextid, language, backend, count):
+            inventory.add(asset, description)
         return inventory
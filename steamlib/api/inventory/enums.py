@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class InventoryBackend(Enum):
+    legacy = 'legacy'
+    cursor = 'cursor'
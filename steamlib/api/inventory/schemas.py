@@ -0,0 +1,127 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class InventoryDescription:
+    """
+    Item description shared by all assets with the same classid and instanceid.
+    """
+
+    __slots__ = ('classid', 'instanceid', 'market_hash_name', 'name', 'tradable', 'marketable', 'raw')
+
+    def __init__(self, description: Dict):
+        self.classid: str = description['classid']
+        self.instanceid: str = description['instanceid']
+        self.market_hash_name: str = description.get('market_hash_name', '')
+        self.name: str = description.get('name', '')
+        self.tradable = bool(description.get('tradable'))
+        self.marketable = bool(description.get('marketable'))
+        self.raw = description
+
+    def __repr__(self) -> str:
+        return f'InventoryDescription(classid={self.classid}, instanceid={self.instanceid}, name={self.name!r})'
+
+
+class InventoryItem:
+
+    __slots__ = ('assetid', 'amount', 'description')
+
+    def __init__(self, assetid: str, amount: int, description: InventoryDescription):
+        self.assetid = assetid
+        self.amount = amount
+        self.description = description
+
+    @property
+    def classid(self) -> str:
+        return self.description.classid
+
+    @property
+    def instanceid(self) -> str:
+        return self.description.instanceid
+
+    @property
+    def market_hash_name(self) -> str:
+        return self.description.market_hash_name
+
+    def __repr__(self) -> str:
+        return f'InventoryItem(assetid={self.assetid}, amount={self.amount}, name={self.description.name!r})'
+
+
+class Inventory:
+    """
+    Inventory of one app and context.
+    Descriptions are stored once per (classid, instanceid), items only reference them.
+    """
+
+    def __init__(self, appid: str, contextid: int):
+        self.appid = appid
+        self.contextid = contextid
+        self.items: Dict[str, InventoryItem] = {}
+        self.descriptions: Dict[Tuple[str, str], InventoryDescription] = {}
+
+    def add(self, asset: Dict, description: Dict) -> InventoryItem:
+        key = (asset['classid'], asset['instanceid'])
+        interned = self.descriptions.get(key)
+        if interned is None:
+            interned = self.descriptions[key] = InventoryDescription(description)
+        item = self.items[asset['id']] = InventoryItem(
+            assetid=asset['id'],
+            amount=int(asset['amount']),
+            description=interned,
+        )
+        return item
+
+    def add_page(self, page: Dict) -> None:
+        descriptions: Dict = page['rgDescriptions'] or {}
+        for asset in (page['rgInventory'] or {}).values():
+            self.add(asset, descriptions[f'{asset["classid"]}_{asset["instanceid"]}'])
+
+    def __getitem__(self, assetid: str) -> InventoryItem:
+        return self.items[assetid]
+
+    def __contains__(self, assetid: object) -> bool:
+        return assetid in self.items
+
+    def __iter__(self) -> Iterator[InventoryItem]:
+        return iter(self.items.values())
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class InventoryDiff:
+
+    __slots__ = ('added', 'removed', 'changed')
+
+    def __init__(
+        self,
+        added: Optional[List[InventoryItem]] = None,
+        removed: Optional[List[InventoryItem]] = None,
+        changed: Optional[List[Tuple[InventoryItem, InventoryItem]]] = None,
+    ):
+        self.added: List[InventoryItem] = added or []
+        self.removed: List[InventoryItem] = removed or []
+        self.changed: List[Tuple[InventoryItem, InventoryItem]] = changed or []
+
+    @classmethod
+    def between(cls, previous: Optional[Inventory], current: Inventory) -> 'InventoryDiff':
+        """
+        changed contains (previous, current) pairs of items with different amount.
+        """
+        if previous is None:
+            return cls(added=list(current))
+        before, after = previous.items, current.items
+        return cls(
+            added=[after[assetid] for assetid in after.keys() - before.keys()],
+            removed=[before[assetid] for assetid in before.keys() - after.keys()],
+            changed=[
+                (before[assetid], after[assetid])
+                for assetid in after.keys() & before.keys()
+                if before[assetid].amount != after[assetid].amount
+            ],
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return f'InventoryDiff(added={len(self.added)}, removed={len(self.removed)}, changed={len(self.changed)})'
@@ -0,0 +1,55 @@
+from typing import Dict, Optional
+
+from steamlib.api.enums import Language
+
+from .api import SteamInventory
+from .enums import InventoryBackend
+from .schemas import Inventory, InventoryDiff
+
+
+class InventorySnapshot:
+    """
+    Keeps the last fetched inventory and returns changes since the previous update.
+
+    With quick=True the update stops after the first page if it is identical to
+    the first page of the previous update. New assets always appear on the first
+    page, but assets removed from later pages are reported only by a full update.
+    """
+
+    def __init__(
+        self,
+        inventory: SteamInventory,
+        appid: str,
+        contextid: int,
+        language: Language = Language.english,
+        backend: InventoryBackend = InventoryBackend.legacy,
+        count: int = 2000,
+        quick: bool = False,
+    ):
+        self._inventory = inventory
+        self.appid = appid
+        self.contextid = contextid
+        self.language = language
+        self.backend = backend
+        self.count = count
+        self.quick = quick
+        self.current: Optional[Inventory] = None
+        self._first_page: Optional[Dict[str, str]] = None
+
+    async def update(self) -> InventoryDiff:
+        inventory = Inventory(appid=self.appid, contextid=self.contextid)
+        pages = self._inventory._pages(self.appid, self.contextid, self.language, self.backend, self.count)
+        first_page: Optional[Dict[str, str]] = None
+        async for page in pages:
+            if first_page is None:
+                first_page = {
+                    assetid: asset['amount'] for assetid, asset in (page['rgInventory'] or {}).items()
+                }
+                if self.quick and self.current is not None and first_page == self._first_page:
+                    await pages.aclose()
+                    return InventoryDiff()
+            inventory.add_page(page)
+        diff = InventoryDiff.between(self.current, inventory)
+        self.current = inventory
+        self._first_page = first_page
+        return diff
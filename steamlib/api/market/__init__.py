@@ -1,8 +1,12 @@
 from .api import SteamMarket
-from .schemas import PriceHistoryResponse, Sale
+from .schemas import PriceHistoryColumns, PriceHistoryColumnsResponse, PriceHistoryResponse, Sale
+from .storage import PriceHistoryStorage
 
 __all__ = [
     'SteamMarket',
     'Sale',
     'PriceHistoryResponse',
+    'PriceHistoryColumns',
+    'PriceHistoryColumnsResponse',
+    'PriceHistoryStorage',
 ]
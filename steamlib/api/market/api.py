@@ -1,13 +1,24 @@
-from pysteamauth.auth import Steam
+import asyncio
+from typing import TYPE_CHECKING, AsyncGenerator, Iterable, List, Optional, Tuple, Union
 
-from .schemas import PriceHistoryResponse
+from steamlib.ratelimit import Pacer
+from steamlib.singleflight import SingleFlight, coalesce
+
+from .schemas import PriceHistoryColumnsResponse, PriceHistoryResponse
+
+if TYPE_CHECKING:
+    from pysteamauth.auth import Steam
+
+PriceHistoryResult = Tuple[Tuple[str, str], Union[PriceHistoryResponse, Exception]]
 
 
 class SteamMarket:
 
-    def __init__(self, steam: Steam):
+    def __init__(self, steam: 'Steam', single_flight: Optional[SingleFlight] = None):
         self.steam = steam
+        self.single_flight = single_flight
 
+    @coalesce
     async def is_market_available(self) -> bool:
         response: str = await self.steam.request(
             url='https://steamcommunity.com/market/',
@@ -22,6 +33,7 @@ class SteamMarket:
         )
         return 'The Market is unavailable for the following reason(s):' not in response
 
+    @coalesce
     async def price_history(self, appid: str, market_hash_name: str) -> PriceHistoryResponse:
         response: str = await self.steam.request(
             url='https://steamcommunity.com/market/pricehistory/',
@@ -36,3 +48,54 @@ class SteamMarket:
             },
         )
         return PriceHistoryResponse.parse_raw(response)
+
+    @coalesce
+    async def price_history_columns(self, appid: str, market_hash_name: str) -> PriceHistoryColumnsResponse:
+        response: str = await self.steam.request(
+            url='https://steamcommunity.com/market/pricehistory/',
+            headers={
+                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:1.9.5.20) Gecko/2812-12-10 04:56:28 Firefox/3.8',
+            },
+            params={
+                'country': 'US',
+                'currency': '1',
+                'appid': appid,
+                'market_hash_name': market_hash_name,
+            },
+        )
+        return PriceHistoryColumnsResponse.parse_raw(response)
+
+    async def price_histories(
+        self,
+        items: Iterable[Tuple[str, str]],
+        limit: int = 4,
+        delay: float = 0.0,
+    ) -> AsyncGenerator[PriceHistoryResult, None]:
+        """
+        Fetch price history of many (appid, market_hash_name) pairs and yield
+        ((appid, market_hash_name), result) in order of completion.
+        A failed item yields its exception instead of PriceHistoryResponse.
+
+        :param limit: Maximum number of requests at the same time.
+        :param delay: Minimum interval in seconds between starts of two requests.
+        """
+        semaphore = asyncio.Semaphore(limit)
+        pacer = Pacer(delay)
+
+        async def fetch(appid: str, market_hash_name: str) -> PriceHistoryResult:
+            async with semaphore:
+                await pacer.wait()
+                try:
+                    return (appid, market_hash_name), await self.price_history(appid, market_hash_name)
+                except Exception as error:
+                    return (appid, market_hash_name), error
+
+        tasks: List[asyncio.Future] = [
+            asyncio.ensure_future(fetch(appid, market_hash_name)) for appid, market_hash_name in items
+        ]
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
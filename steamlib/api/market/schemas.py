@@ -1,9 +1,19 @@
-from datetime import datetime
+from array import array
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, validator
 
+from steamlib.schemas import SteamModel
+
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
 
 class Sale(BaseModel):
     sale: datetime = Field(description='Date of sale')
@@ -11,7 +21,7 @@ class Sale(BaseModel):
     weight: int = Field(description='Amount of sold items')
 
 
-class PriceHistoryResponse(BaseModel):
+class PriceHistoryResponse(SteamModel):
     success: bool
     price_prefix: str
     price_suffix: str
@@ -22,6 +32,18 @@ class PriceHistoryResponse(BaseModel):
         if not value:
             return None
         prices = []
+        if cls.trusted:
+            days: Dict[str, int] = {}
+            timestamp = PriceHistoryColumns._timestamp
+            for date_of_sale, price, weight in value:
+                prices.append(
+                    Sale.construct(
+                        sale=_EPOCH + timedelta(seconds=timestamp(date_of_sale, days)),
+                        price=Decimal(str(price)),
+                        weight=int(weight),
+                    ),
+                )
+            return prices
         for date_of_sale, price, weight in value:
             prices.append(
                 Sale(
@@ -31,3 +53,84 @@ class PriceHistoryResponse(BaseModel):
                 ),
             )
         return prices
+
+
+class PriceHistoryColumns:
+    """
+    Price history stored column by column.
+    Timestamps are unix seconds of the sale hour, prices and volumes share their indexes.
+    """
+
+    __slots__ = ('timestamps', 'prices', 'volumes', '_sales')
+
+    def __init__(self, timestamps: array, prices: array, volumes: array):
+        self.timestamps = timestamps
+        self.prices = prices
+        self.volumes = volumes
+        self._sales: Optional[List[Sale]] = None
+
+    @staticmethod
+    def _timestamp(date_of_sale: str, days: Dict[str, int]) -> int:
+        """
+        Parse "Jul 02 2014 01: +0" by slicing, days since epoch are cached per date.
+        """
+        day = date_of_sale[:11]
+        ordinal = days.get(day)
+        if ordinal is None:
+            month = _MONTHS.get(day[:3])
+            if month is None or len(date_of_sale) < 14:
+                sale = datetime.strptime(date_of_sale.split(':')[0], '%b %d %Y %H')
+                return int((sale - _EPOCH).total_seconds())
+            ordinal = days[day] = date(int(day[7:11]), month, int(day[4:6])).toordinal() - _EPOCH_ORDINAL
+        return ordinal * 86400 + int(date_of_sale[12:14]) * 3600
+
+    @classmethod
+    def from_raw(cls, value: List) -> 'PriceHistoryColumns':
+        days: Dict[str, int] = {}
+        timestamp = cls._timestamp
+        return cls(
+            timestamps=array('q', [timestamp(point[0], days) for point in value]),
+            prices=array('d', [point[1] for point in value]),
+            volumes=array('q', [int(point[2]) for point in value]),
+        )
+
+    @property
+    def sales(self) -> List[Sale]:
+        if self._sales is None:
+            self._sales = [
+                Sale(
+                    sale=_EPOCH + timedelta(seconds=timestamp),
+                    price=price,
+                    weight=volume,
+                )
+                for timestamp, price, volume in zip(self.timestamps, self.prices, self.volumes)
+            ]
+        return self._sales
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+class PriceHistoryColumnsResponse(SteamModel):
+    success: bool
+    price_prefix: str
+    price_suffix: str
+    columns: Optional[PriceHistoryColumns] = Field(alias='prices')
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @validator('columns', pre=True)
+    def _columns(cls, value) -> Optional[PriceHistoryColumns]:  # noqa:U100
+        if not value:
+            return None
+        return PriceHistoryColumns.from_raw(value)
+
+    @property
+    def prices(self) -> Optional[List[Sale]]:
+        """
+        Sale list built on first access.
+        """
+        if self.columns is None:
+            return None
+        return self.columns.sales
@@ -0,0 +1,115 @@
+import calendar
+import sqlite3
+import time
+from array import array
+from datetime import datetime
+from typing import Optional
+
+from .api import SteamMarket
+from .schemas import PriceHistoryColumns
+
+
+class PriceHistoryStorage:
+    """
+    Local SQLite storage of price history keyed by (appid, market_hash_name).
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        self._db = sqlite3.connect(path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS price_history (
+                appid TEXT NOT NULL,
+                market_hash_name TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                price REAL NOT NULL,
+                volume INTEGER NOT NULL,
+                PRIMARY KEY (appid, market_hash_name, timestamp)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS price_history_sync (
+                appid TEXT NOT NULL,
+                market_hash_name TEXT NOT NULL,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (appid, market_hash_name)
+            ) WITHOUT ROWID;
+            """,
+        )
+
+    def close(self) -> None:
+        self._db.close()
+
+    def last_timestamp(self, appid: str, market_hash_name: str) -> Optional[int]:
+        row = self._db.execute(
+            'SELECT MAX(timestamp) FROM price_history WHERE appid = ? AND market_hash_name = ?',
+            (appid, market_hash_name),
+        ).fetchone()
+        return row[0]
+
+    def synced_at(self, appid: str, market_hash_name: str) -> Optional[float]:
+        row = self._db.execute(
+            'SELECT synced_at FROM price_history_sync WHERE appid = ? AND market_hash_name = ?',
+            (appid, market_hash_name),
+        ).fetchone()
+        return row[0] if row else None
+
+    def merge(self, appid: str, market_hash_name: str, columns: Optional[PriceHistoryColumns]) -> int:
+        """
+        Store points not older than the last stored one.
+        The last stored point is overwritten because Steam updates the current period.
+
+        :return: Number of written points.
+        """
+        written = 0
+        if columns is not None:
+            last = self.last_timestamp(appid, market_hash_name)
+            rows = [
+                (appid, market_hash_name, timestamp, price, volume)
+                for timestamp, price, volume in zip(columns.timestamps, columns.prices, columns.volumes)
+                if last is None or timestamp >= last
+            ]
+            self._db.executemany('INSERT OR REPLACE INTO price_history VALUES (?, ?, ?, ?, ?)', rows)
+            written = len(rows)
+        self._db.execute(
+            'INSERT OR REPLACE INTO price_history_sync VALUES (?, ?, ?)',
+            (appid, market_hash_name, time.time()),
+        )
+        self._db.commit()
+        return written
+
+    async def sync(self, market: SteamMarket, appid: str, market_hash_name: str, max_age: float = 3600) -> int:
+        """
+        Download price history if it was not synced during the last max_age seconds.
+
+        :return: Number of written points.
+        """
+        synced_at = self.synced_at(appid, market_hash_name)
+        if synced_at is not None and time.time() - synced_at < max_age:
+            return 0
+        response = await market.price_history_columns(appid, market_hash_name)
+        return self.merge(appid, market_hash_name, response.columns)
+
+    def range(
+        self,
+        appid: str,
+        market_hash_name: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> PriceHistoryColumns:
+        """
+        Stored points between start and end inclusive, without network requests.
+        Naive dates are treated as UTC like Sale.sale.
+        """
+        query = 'SELECT timestamp, price, volume FROM price_history WHERE appid = ? AND market_hash_name = ?'
+        params: list = [appid, market_hash_name]
+        if start is not None:
+            query += ' AND timestamp >= ?'
+            params.append(calendar.timegm(start.utctimetuple()))
+        if end is not None:
+            query += ' AND timestamp <= ?'
+            params.append(calendar.timegm(end.utctimetuple()))
+        timestamps, prices, volumes = array('q'), array('d'), array('q')
+        for timestamp, price, volume in self._db.execute(query + ' ORDER BY timestamp', params):
+            timestamps.append(timestamp)
+            prices.append(price)
+            volumes.append(volume)
+        return PriceHistoryColumns(timestamps, prices, volumes)
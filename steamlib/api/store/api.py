@@ -1,13 +1,44 @@
-from pysteamauth.auth import Steam
+import asyncio
+from typing import TYPE_CHECKING, Dict, List
 
 from steamlib.api.store.purchase import TransactionStatusResponse
-from steamlib.api.store.purchase.api import PurchaseGame
+from steamlib.api.store.purchase.api import PurchaseGame, wait_for_transaction
+
+if TYPE_CHECKING:
+    from pysteamauth.auth import Steam
 
 
 class SteamStore:
 
-    def __init__(self, steam: Steam):
+    def __init__(self, steam: 'Steam'):
         self.steam = steam
 
     async def purchase_game(self, appid: str) -> TransactionStatusResponse:
         return await PurchaseGame(self.steam, appid).purchase()
+
+    async def purchase_games(self, appids: List[str]) -> TransactionStatusResponse:
+        """
+        Buy several games with one cart and one transaction.
+        Store pages are downloaded concurrently, items are added to the cart one by one.
+        """
+        if not appids:
+            raise ValueError('No appids to purchase')
+        purchases = [PurchaseGame(self.steam, appid) for appid in appids]
+        carts = await asyncio.gather(*(purchase.get_data_for_cart() for purchase in purchases))
+        cart_number = 0
+        for purchase, cart_data in zip(purchases, carts):
+            cart_number = await purchase.add_data_to_cart(cart_data)
+        return await purchases[-1].checkout(cart_number)
+
+    async def wait_for_transactions(
+        self,
+        transids: List[str],
+        timeout: float = 30,
+    ) -> Dict[str, TransactionStatusResponse]:
+        """
+        Wait for several transactions concurrently, see wait_for_transaction.
+        """
+        statuses = await asyncio.gather(
+            *(wait_for_transaction(self.steam, transid, timeout) for transid in transids),
+        )
+        return dict(zip(transids, statuses))
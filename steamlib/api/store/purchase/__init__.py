@@ -1,4 +1,4 @@
-from .api import PurchaseGame
+from .api import PurchaseGame, transaction_status, wait_for_transaction
 from .schemas import (
     FinalizeTransactionResponse,
     FinalPriceRequest,
@@ -18,4 +18,6 @@ __all__ = [
     'FinalPriceResponse',
     'TransactionStatusResponse',
     'FinalizeTransactionResponse',
+    'transaction_status',
+    'wait_for_transaction',
 ]
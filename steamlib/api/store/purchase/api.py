@@ -1,7 +1,9 @@
-from typing import Dict
+import asyncio
+import random
+import time
+from typing import TYPE_CHECKING, Dict, Tuple
 
-from lxml.html import HtmlElement, document_fromstring
-from pysteamauth.auth import Steam
+from steamlib.extract import input_value, parse_document
 
 from .schemas import (
     FinalizeTransactionResponse,
@@ -12,28 +14,96 @@ from .schemas import (
     TransactionStatusResponse,
 )
 
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+    from pysteamauth.auth import Steam
+
+
+async def transaction_status(steam: 'Steam', transid: str) -> TransactionStatusResponse:
+    response: str = await steam.request(
+        method='POST',
+        url='https://store.steampowered.com/checkout/transactionstatus/',
+        data={
+            'count': '1',
+            'transid': transid,
+        },
+        headers={
+            'Accept': 'text/javascript, text/html, application/xml, text/xml, */*',
+            'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+            'Origin': 'https://store.steampowered.com',
+            'X-Requested-With': 'XMLHttpRequest',
+            'X-Prototype-Version:': '1.7',
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:1.9.5.20) Gecko/2812-12-10 04:56:28 Firefox/3.8',
+        },
+    )
+    return TransactionStatusResponse.parse_raw(response)
+
+
+async def wait_for_transaction(
+    steam: 'Steam',
+    transid: str,
+    timeout: float = 30,
+    delay: float = 0.5,
+    max_delay: float = 8,
+) -> TransactionStatusResponse:
+    """
+    Poll transaction status with exponential backoff and jitter until it is not pending.
+    After timeout the last pending status is returned.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        status = await transaction_status(steam, transid)
+        remaining = deadline - loop.time()
+        if not status.pending or remaining <= 0:
+            return status
+        await asyncio.sleep(min(delay / 2 + random.uniform(0, delay / 2), remaining))
+        delay = min(delay * 2, max_delay)
+
 
 class PurchaseGame:
 
-    def __init__(self, steam: Steam, appid: str):
+    cart_data_ttl: float = 3600
+    _cart_data: Dict[str, Tuple[float, Dict]] = {}
+
+    def __init__(self, steam: 'Steam', appid: str):
         self.appid = appid
         self.steam = steam
 
-    async def game_page(self) -> HtmlElement:
-        response: str = await self.steam.request(
+    async def _game_page(self) -> str:
+        return await self.steam.request(
             url=f'https://store.steampowered.com/app/{self.appid}/',
         )
-        return document_fromstring(response)
+
+    async def game_page(self) -> 'HtmlElement':
+        return parse_document(await self._game_page())
 
     async def get_data_for_cart(self) -> Dict:
-        page: HtmlElement = await self.game_page()
-        result = {}
-        for param in ('snr', 'originating_snr', 'action', 'sessionid', 'subid'):
-            result[param] = page.cssselect(f'input[name="{param}"]')[0].attrib['value']
-        return result
+        """
+        Cart fields of the store page are cached per appid for cart_data_ttl seconds
+        and shared between accounts, sessionid is taken from the store session.
+        """
+        now = time.monotonic()
+        cached = self._cart_data.get(self.appid)
+        if cached is None or now >= cached[0]:
+            response: str = await self._game_page()
+            result = {}
+            for param in ('snr', 'originating_snr', 'action', 'subid'):
+                result[param] = input_value(response, param)
+            for appid in [appid for appid, (expires, _) in self._cart_data.items() if now >= expires]:
+                del self._cart_data[appid]
+            self._cart_data[self.appid] = (now + self.cart_data_ttl, result)
+        else:
+            result = cached[1]
+        return {
+            **result,
+            'sessionid': await self.steam.sessionid(domain='store.steampowered.com'),
+        }
 
     async def add_to_cart(self) -> int:
-        cart_data = await self.get_data_for_cart()
+        return await self.add_data_to_cart(await self.get_data_for_cart())
+
+    async def add_data_to_cart(self, cart_data: Dict) -> int:
         response: str = await self.steam.request(
             method='POST',
             url='https://store.steampowered.com/cart/',
@@ -45,7 +115,7 @@ class PurchaseGame:
                 'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:1.9.5.20) Gecko/2812-12-10 04:56:28 Firefox/3.8',
             },
         )
-        page: HtmlElement = document_fromstring(response)
+        page = parse_document(response)
         return int(page.cssselect('.cart_area_body input[name="cart"]')[0].attrib['value'])
 
     async def init_transaction(self, request: PurshaseTransactionRequest) -> PurshaseTransactionResponse:
@@ -85,23 +155,16 @@ class PurchaseGame:
         return FinalizeTransactionResponse.parse_raw(response)
 
     async def transaction_status(self, transid: str) -> TransactionStatusResponse:
-        response: str = await self.steam.request(
-            method='POST',
-            url='https://store.steampowered.com/checkout/transactionstatus/',
-            data={
-                'count': '1',
-                'transid': transid,
-            },
-            headers={
-                'Accept': 'text/javascript, text/html, application/xml, text/xml, */*',
-                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-                'Origin': 'https://store.steampowered.com',
-                'X-Requested-With': 'XMLHttpRequest',
-                'X-Prototype-Version:': '1.7',
-                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:1.9.5.20) Gecko/2812-12-10 04:56:28 Firefox/3.8',
-            },
-        )
-        return TransactionStatusResponse.parse_raw(response)
+        return await transaction_status(self.steam, transid)
+
+    async def wait_for_transaction(
+        self,
+        transid: str,
+        timeout: float = 30,
+        delay: float = 0.5,
+        max_delay: float = 8,
+    ) -> TransactionStatusResponse:
+        return await wait_for_transaction(self.steam, transid, timeout, delay, max_delay)
 
     async def final_price(self, request: FinalPriceRequest) -> FinalPriceResponse:
         response: str = await self.steam.request(
@@ -119,7 +182,9 @@ class PurchaseGame:
         return FinalPriceResponse.parse_raw(response)
 
     async def purchase(self) -> TransactionStatusResponse:
-        cart_number: int = await self.add_to_cart()
+        return await self.checkout(await self.add_to_cart())
+
+    async def checkout(self, cart_number: int) -> TransactionStatusResponse:
         transaction: PurshaseTransactionResponse = await self.init_transaction(
             request=PurshaseTransactionRequest(
                 gidShoppingCart=cart_number,
@@ -133,4 +198,4 @@ class PurchaseGame:
             ),
         )
         await self.finalize_transaction(transaction.transid)
-        return await self.transaction_status(transaction.transid)
+        return await self.wait_for_transaction(transaction.transid)
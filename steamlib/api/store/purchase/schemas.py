@@ -84,9 +84,13 @@ class PurchaseReceipt(BaseModel):
 
 class TransactionStatusResponse(BaseSteamResponse):
     purchaseresultdetail: int
-    purchasereceipt: PurchaseReceipt
-    strReceiptPageHTML: str
-    bShowBRSpecificCreditCardError: bool
+    purchasereceipt: Optional[PurchaseReceipt] = None
+    strReceiptPageHTML: Optional[str] = None
+    bShowBRSpecificCreditCardError: Optional[bool] = None
+
+    @property
+    def pending(self) -> bool:
+        return self.success == 22
 
 
 class FinalPriceRequest(BaseModel):
@@ -1,9 +1,27 @@
 from .api import SteamTrade
-from .schemas import Asset, MobileConfirmation, SendOfferRequest
+from .enums import TradeOfferState
+from .schemas import (
+    Asset,
+    GetTradeOffersResponse,
+    MobileConfirmation,
+    MultiConfirmationResult,
+    SendOfferRequest,
+    SendOfferResult,
+    TradeOffer,
+    TradeOfferItem,
+)
+from .watcher import TradeOfferWatcher
 
 __all__ = [
     'SteamTrade',
     'Asset',
+    'GetTradeOffersResponse',
     'MobileConfirmation',
+    'MultiConfirmationResult',
     'SendOfferRequest',
+    'SendOfferResult',
+    'TradeOffer',
+    'TradeOfferItem',
+    'TradeOfferState',
+    'TradeOfferWatcher',
 ]
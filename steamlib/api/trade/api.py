@@ -1,24 +1,49 @@
-import json
-from typing import Any, Dict, Union
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Iterable, List, Optional, Tuple, Union
 
-from pysteamauth.auth import Steam
+from aiohttp import FormData
 from yarl import URL
 
+from steamlib import codec
+from steamlib.ratelimit import Pacer
+from steamlib.singleflight import SingleFlight, coalesce
+
 from .exceptions import GetConfirmationsError, NotFoundMobileConfirmationError, SendOfferError
-from .schemas import GetMobileConfirmationResponse, SendOfferRequest
+from .schemas import (
+    GetMobileConfirmationResponse,
+    GetTradeOffersResponse,
+    MobileConfirmation,
+    MultiConfirmationResult,
+    SendOfferRequest,
+    SendOfferResult,
+    TradeOffer,
+)
+from .server_time import ServerTime
+
+if TYPE_CHECKING:
+    from pysteamauth.auth import Steam
 
 
 class SteamTrade:
 
-    def __init__(self, steam: Steam):
+    def __init__(self, steam: 'Steam', single_flight: Optional[SingleFlight] = None):
         self.steam = steam
+        self.single_flight = single_flight
+        self.server_time = ServerTime(steam)
 
-    async def send_offer(self, request: SendOfferRequest) -> Dict:
-        params = URL(request.tradelink).query
+    def _tradelink_token(self, tradelink: str) -> str:
+        params = URL(tradelink).query
         if 'partner' not in params:
             raise ValueError('Partner parameter is missing in tradelink')
         if 'token' not in params:
             raise ValueError('Token parameter is missing in tradelink')
+        return params['token']
+
+    async def send_offer(self, request: SendOfferRequest) -> Dict:
+        token = self._tradelink_token(request.tradelink)
+        return await self._send_offer(request, token, await self.steam.sessionid())
+
+    async def _send_offer(self, request: SendOfferRequest, token: str, sessionid: str) -> Dict:
         response: str = await self.steam.request(
             method='POST',
             url='https://steamcommunity.com/tradeoffer/new/send',
@@ -34,11 +59,11 @@ class SteamTrade:
                 'serverid': '1',
                 'partner': request.partner,
                 'tradeoffermessage': request.tradeoffermessage,
-                'sessionid': await self.steam.sessionid(),
-                'trade_offer_create_params': json.dumps({
-                    'trade_offer_access_token': params['token'],
+                'sessionid': sessionid,
+                'trade_offer_create_params': codec.dumps({
+                    'trade_offer_access_token': token,
                 }),
-                'json_tradeoffer': json.dumps({
+                'json_tradeoffer': codec.dumps({
                     'newversion': True,
                     'version': 2,
                     'me': {
@@ -56,7 +81,7 @@ class SteamTrade:
         )
         if response == 'null':
             raise SendOfferError('Send offer error')
-        return json.loads(response)
+        return codec.loads(response)
 
     async def accept_offer(self, tradeofferid: Union[int, str], partner_steamid: int) -> Dict:
         response: str = await self.steam.request(
@@ -77,7 +102,7 @@ class SteamTrade:
                 'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:1.9.5.20) Gecko/2812-12-10 04:56:28 Firefox/3.8',
             },
         )
-        return json.loads(response)
+        return codec.loads(response)
 
     async def cancel_offer(self, tradeofferid: Union[int, str]) -> Any:
         response: str = await self.steam.request(
@@ -94,7 +119,7 @@ class SteamTrade:
                 'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:1.9.5.20) Gecko/2812-12-10 04:56:28 Firefox/3.8',
             },
         )
-        return json.loads(response)
+        return codec.loads(response)
 
     async def decline_offer(self, tradeofferid: Union[int, str]) -> Any:
         response: str = await self.steam.request(
@@ -111,10 +136,76 @@ class SteamTrade:
                 'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:1.9.5.20) Gecko/2812-12-10 04:56:28 Firefox/3.8',
             },
         )
-        return json.loads(response)
+        return codec.loads(response)
+
+    @coalesce
+    async def get_trade_offers(
+        self,
+        api_key: str,
+        sent: bool = True,
+        received: bool = True,
+        active_only: bool = True,
+        historical_only: bool = False,
+        time_historical_cutoff: Optional[int] = None,
+        cursor: int = 0,
+    ) -> GetTradeOffersResponse:
+        """
+        One page of trade offers from IEconService/GetTradeOffers.
+
+        :param active_only: Only active offers and offers changed after time_historical_cutoff.
+        :param cursor: next_cursor of the previous page.
+        """
+        params = {
+            'key': api_key,
+            'get_sent_offers': int(sent),
+            'get_received_offers': int(received),
+            'active_only': int(active_only),
+            'historical_only': int(historical_only),
+            'get_descriptions': 0,
+            'cursor': cursor,
+        }
+        if time_historical_cutoff is not None:
+            params['time_historical_cutoff'] = time_historical_cutoff
+        response: str = await self.steam.request(
+            url='https://api.steampowered.com/IEconService/GetTradeOffers/v1/',
+            params=params,
+            raise_for_status=True,
+        )
+        return GetTradeOffersResponse.parse_obj(codec.loads(response).get('response', {}))
+
+    async def iter_trade_offers(
+        self,
+        api_key: str,
+        sent: bool = True,
+        received: bool = True,
+        active_only: bool = True,
+        historical_only: bool = False,
+        time_historical_cutoff: Optional[int] = None,
+    ) -> AsyncGenerator[TradeOffer, None]:
+        cursor = 0
+        while True:
+            page = await self.get_trade_offers(
+                api_key=api_key,
+                sent=sent,
+                received=received,
+                active_only=active_only,
+                historical_only=historical_only,
+                time_historical_cutoff=time_historical_cutoff,
+                cursor=cursor,
+            )
+            for offer in page.trade_offers_sent:
+                yield offer
+            for offer in page.trade_offers_received:
+                yield offer
+            if not page.next_cursor:
+                break
+            cursor = page.next_cursor
 
     async def get_mobile_confirmations(self) -> GetMobileConfirmationResponse:
-        server_time: int = await self.steam.get_server_time()
+        """
+        Not coalesced, a list requested before an offer was sent can miss its confirmation.
+        """
+        server_time: int = await self.server_time.now()
         confirmation_hash: str = self.steam.get_confirmation_hash(
             server_time=server_time,
         )
@@ -136,10 +227,13 @@ class SteamTrade:
                 'tag': 'conf',
             },
         )
-        return GetMobileConfirmationResponse.parse_raw(response)
+        confirmations = GetMobileConfirmationResponse.parse_raw(response)
+        if confirmations.success is False:
+            self.server_time.invalidate()
+        return confirmations
 
     async def mobile_confirm(self, confirmation_id: int, confirmation_key: int) -> Dict:
-        server_time: int = await self.steam.get_server_time()
+        server_time: int = await self.server_time.now()
         confirmation_hash: str = self.steam.get_confirmation_hash(
             server_time=server_time,
             tag='allow',
@@ -163,7 +257,36 @@ class SteamTrade:
                 'ck': confirmation_key,
             },
         )
-        return json.loads(response)
+        return codec.loads(response)
+
+    async def mobile_multi_confirm(self, confirmations: List[MobileConfirmation]) -> Dict:
+        server_time: int = await self.server_time.now()
+        confirmation_hash: str = self.steam.get_confirmation_hash(
+            server_time=server_time,
+            tag='allow',
+        )
+        response: str = await self.steam.request(
+            url='https://steamcommunity.com/mobileconf/multiajaxop',
+            method='POST',
+            cookies={
+                'mobileClient': 'ios',
+                'mobileClientVersion': '2.0.20',
+            },
+            data=FormData(
+                fields=[
+                    ('op', 'allow'),
+                    ('p', self.steam.device_id),
+                    ('a', str(self.steam.steamid)),
+                    ('k', confirmation_hash),
+                    ('t', str(server_time)),
+                    ('m', 'react'),
+                    ('tag', 'allow'),
+                    *[('cid[]', str(confirmation.confirmation_id)) for confirmation in confirmations],
+                    *[('ck[]', str(confirmation.confirmation_key)) for confirmation in confirmations],
+                ],
+            ),
+        )
+        return codec.loads(response)
 
     async def mobile_confirm_by_creator_id(self, creator_id: Union[int, str]) -> Dict:
         """
@@ -184,3 +307,124 @@ class SteamTrade:
                     confirmation_key=confirmation.confirmation_key,
                 )
         raise NotFoundMobileConfirmationError(f'Not found confirmation for creator_id={creator_id}')
+
+    async def mobile_confirm_many(self, creator_ids: Iterable[Union[int, str]]) -> MultiConfirmationResult:
+        """
+        Confirm many trade offers with one confirmation list request and one multi confirmation request.
+        """
+        ids: List[int] = []
+        for creator_id in creator_ids:
+            if isinstance(creator_id, str) and not creator_id.isdigit():
+                raise TypeError(f'Invalid value of creator_id {creator_id}')
+            ids.append(int(creator_id))
+        ids = list(dict.fromkeys(ids))
+        confirmations = await self.get_mobile_confirmations()
+        if confirmations.success is False:
+            raise GetConfirmationsError(
+                message=confirmations.message,
+                detail=confirmations.detail,
+            )
+        index = {confirmation.creator_id: confirmation for confirmation in confirmations.conf}
+        found = [index[creator_id] for creator_id in ids if creator_id in index]
+        result = MultiConfirmationResult(
+            not_found=[creator_id for creator_id in ids if creator_id not in index],
+        )
+        if found:
+            response = await self.mobile_multi_confirm(found)
+            if response.get('success'):
+                result.confirmed = [confirmation.creator_id for confirmation in found]
+            else:
+                result.failed = [confirmation.creator_id for confirmation in found]
+        return result
+
+    async def send_offers(
+        self,
+        requests: Iterable[SendOfferRequest],
+        limit: int = 4,
+        delay: float = 0.0,
+        confirm: bool = True,
+        confirm_batch: int = 50,
+    ) -> AsyncGenerator[SendOfferResult, None]:
+        """
+        Send many trade offers and yield results as they are ready.
+
+        Tradelinks are validated before the first offer is sent, invalid ones are yielded with error.
+        Offers waiting for mobile confirmation are confirmed by batches of confirm_batch offers
+        while next offers are being sent.
+
+        :param limit: Maximum number of offers sent at the same time.
+        :param delay: Minimum interval in seconds between starts of two sends.
+        """
+        valid: List[Tuple[SendOfferRequest, str]] = []
+        for request in requests:
+            try:
+                valid.append((request, self._tradelink_token(request.tradelink)))
+            except ValueError as error:
+                yield SendOfferResult(request=request, error=str(error))
+        if not valid:
+            return
+
+        sessionid = await self.steam.sessionid()
+        semaphore = asyncio.Semaphore(limit)
+        pacer = Pacer(delay)
+        results: asyncio.Queue = asyncio.Queue()
+        unconfirmed: List[Tuple[int, SendOfferResult]] = []
+        confirmations: List[asyncio.Future] = []
+
+        async def confirm_offers(batch: List[Tuple[int, SendOfferResult]]) -> None:
+            try:
+                confirmed = await self.mobile_confirm_many([tradeofferid for tradeofferid, _ in batch])
+            except Exception as error:
+                for _, result in batch:
+                    result.confirmed = False
+                    result.error = str(error)
+            else:
+                for tradeofferid, result in batch:
+                    result.confirmed = tradeofferid in confirmed.confirmed
+            for _, result in batch:
+                results.put_nowait(result)
+
+        def flush() -> None:
+            if unconfirmed:
+                confirmations.append(asyncio.ensure_future(confirm_offers(unconfirmed[:])))
+                unconfirmed.clear()
+
+        async def send(request: SendOfferRequest, token: str) -> None:
+            async with semaphore:
+                await pacer.wait()
+                try:
+                    response = await self._send_offer(request, token, sessionid)
+                    result = SendOfferResult(request=request, response=response, error=response.get('strError'))
+                    tradeofferid = None
+                    if confirm and response.get('needs_mobile_confirmation') and 'tradeofferid' in response:
+                        tradeofferid = int(response['tradeofferid'])
+                except Exception as error:
+                    results.put_nowait(SendOfferResult(request=request, error=str(error)))
+                    return
+            if tradeofferid is not None:
+                unconfirmed.append((tradeofferid, result))
+                if len(unconfirmed) >= confirm_batch:
+                    flush()
+            else:
+                results.put_nowait(result)
+
+        async def run() -> None:
+            try:
+                await asyncio.gather(*(send(request, token) for request, token in valid))
+                flush()
+                await asyncio.gather(*confirmations)
+            finally:
+                results.put_nowait(None)
+
+        task = asyncio.ensure_future(run())
+        try:
+            while True:
+                result = await results.get()
+                if result is None:
+                    break
+                yield result
+            await task
+        finally:
+            task.cancel()
+            for confirmation in confirmations:
+                confirmation.cancel()
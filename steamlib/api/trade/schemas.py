@@ -1,7 +1,10 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from steamlib.api.trade.enums import TradeOfferState
+from steamlib.schemas import SteamModel
+
 
 class Asset(BaseModel):
     appid: str
@@ -36,8 +39,54 @@ class MobileConfirmation(BaseModel):
         allow_population_by_field_name = True
 
 
-class GetMobileConfirmationResponse(BaseModel):
+class GetMobileConfirmationResponse(SteamModel):
     success: bool
     message: Optional[str] = None
     detail: Optional[str] = None
     conf: List[MobileConfirmation] = []
+
+
+class MultiConfirmationResult(BaseModel):
+    confirmed: List[int] = Field(default=[], description='Confirmed creator ids')
+    failed: List[int] = Field(default=[], description='Creator ids rejected by Steam')
+    not_found: List[int] = Field(default=[], description='Creator ids without pending confirmation')
+
+
+class SendOfferResult(BaseModel):
+    request: SendOfferRequest
+    response: Optional[Dict] = Field(default=None, description='Steam response, contains tradeofferid')
+    error: Optional[str] = None
+    confirmed: Optional[bool] = Field(default=None, description='None if mobile confirmation was not required')
+
+
+class TradeOfferItem(BaseModel):
+    appid: int
+    contextid: str
+    assetid: str
+    classid: str
+    instanceid: str
+    amount: int
+    missing: bool = False
+
+
+class TradeOffer(BaseModel):
+    tradeofferid: str
+    accountid_other: int
+    message: str = ''
+    expiration_time: int
+    trade_offer_state: TradeOfferState
+    items_to_give: List[TradeOfferItem] = []
+    items_to_receive: List[TradeOfferItem] = []
+    is_our_offer: bool
+    time_created: int
+    time_updated: int
+    tradeid: Optional[str] = None
+    from_real_time_trade: bool = False
+    escrow_end_date: int = 0
+    confirmation_method: int = 0
+
+
+class GetTradeOffersResponse(SteamModel):
+    trade_offers_sent: List[TradeOffer] = []
+    trade_offers_received: List[TradeOffer] = []
+    next_cursor: int = 0
@@ -0,0 +1,59 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from pysteamauth.auth import Steam
+
+
+class ServerTime:
+    """
+    Steam server time computed from a cached offset to the local clock.
+
+    The offset is synced on first use and then every resync_interval seconds.
+    When the offset drifts more than max_drift seconds between syncs,
+    the interval is halved (down to min_interval), otherwise it grows back.
+    """
+
+    def __init__(
+        self,
+        steam: 'Steam',
+        resync_interval: float = 3600,
+        min_interval: float = 60,
+        max_drift: float = 2,
+    ):
+        self.steam = steam
+        self.resync_interval = resync_interval
+        self.min_interval = min_interval
+        self.max_drift = max_drift
+        self._interval = resync_interval
+        self._offset: Optional[float] = None
+        self._synced_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    def invalidate(self) -> None:
+        self._offset = None
+
+    async def sync(self) -> float:
+        started = time.time()
+        server_time: int = await self.steam.get_server_time()
+        offset = server_time - (started + time.time()) / 2
+        if self._offset is not None:
+            if abs(offset - self._offset) > self.max_drift:
+                self._interval = max(self._interval / 2, self.min_interval)
+            else:
+                self._interval = min(self._interval * 2, self.resync_interval)
+        self._offset = offset
+        self._synced_at = time.monotonic()
+        return offset
+
+    async def now(self) -> int:
+        offset = self._offset
+        if offset is None or time.monotonic() - self._synced_at >= self._interval:
+            if self._lock is None:
+                self._lock = asyncio.Lock()
+            async with self._lock:
+                offset = self._offset
+                if offset is None or time.monotonic() - self._synced_at >= self._interval:
+                    offset = await self.sync()
+        return int(time.time() + offset)
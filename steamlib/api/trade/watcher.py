@@ -0,0 +1,74 @@
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple
+
+from .api import SteamTrade
+from .enums import TradeOfferState
+from .schemas import TradeOffer
+
+
+class TradeOfferWatcher:
+    """
+    Polls trade offers and yields only new offers and offers whose state changed.
+
+    Every poll requests active offers and offers updated since the previous poll,
+    so the amount of received data depends on changes, not on offer history.
+    Polling interval drops to min_interval after changes and grows up to max_interval while nothing happens.
+    """
+
+    def __init__(
+        self,
+        trade: SteamTrade,
+        api_key: str,
+        sent: bool = True,
+        received: bool = True,
+        since: Optional[int] = None,
+        min_interval: float = 5,
+        max_interval: float = 60,
+    ):
+        """
+        :param since: Unix time, offers changed after it are reported on first poll.
+            Steam server time of the first poll if not specified.
+        """
+        self._trade = trade
+        self.api_key = api_key
+        self.sent = sent
+        self.received = received
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.cutoff = since
+        self._seen: Dict[str, Tuple[TradeOfferState, int]] = {}
+
+    async def poll(self) -> List[TradeOffer]:
+        started = await self._trade.server_time.now()
+        changed: List[TradeOffer] = []
+        returned = set()
+        async for offer in self._trade.iter_trade_offers(
+            api_key=self.api_key,
+            sent=self.sent,
+            received=self.received,
+            active_only=True,
+            time_historical_cutoff=started if self.cutoff is None else self.cutoff,
+        ):
+            returned.add(offer.tradeofferid)
+            state = (offer.trade_offer_state, offer.time_updated)
+            if self._seen.get(offer.tradeofferid) != state:
+                self._seen[offer.tradeofferid] = state
+                changed.append(offer)
+        for tradeofferid in [tradeofferid for tradeofferid in self._seen if tradeofferid not in returned]:
+            del self._seen[tradeofferid]
+        self.cutoff = started - 1
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * 2, self.max_interval)
+        return changed
+
+    async def watch(self) -> AsyncGenerator[TradeOffer, None]:
+        while True:
+            for offer in await self.poll():
+                yield offer
+            await asyncio.sleep(self.interval)
+
+    def __aiter__(self) -> AsyncIterator[TradeOffer]:
+        return self.watch()
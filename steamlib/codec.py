@@ -0,0 +1,43 @@
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type:ignore
+
+
+def _orjson_dumps(obj: Any, *, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any) -> str:
+    if kwargs:
+        return json.dumps(obj, default=default, **kwargs)
+    return orjson.dumps(obj, default=default).decode()
+
+
+_loads: Callable[[Union[str, bytes]], Any] = json.loads
+_dumps: Callable[..., str] = json.dumps
+
+
+def set_backend(name: str) -> None:
+    """
+    Select JSON backend used by steamlib: "orjson" or "json".
+    """
+    global _loads, _dumps
+    if name == 'orjson':
+        if orjson is None:
+            raise ImportError('orjson is not installed')
+        _loads, _dumps = orjson.loads, _orjson_dumps
+    elif name == 'json':
+        _loads, _dumps = json.loads, json.dumps
+    else:
+        raise ValueError(f'Unknown JSON backend {name}')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    return _loads(data)
+
+
+def dumps(obj: Any, **kwargs: Any) -> str:
+    return _dumps(obj, **kwargs)
+
+
+set_backend('json' if orjson is None else 'orjson')
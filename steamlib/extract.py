@@ -0,0 +1,134 @@
+import re
+from html import unescape
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
+_ATTRIBUTE = re.compile(r'''\s*([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?''')
+_TAG_NAME = re.compile(r'<([a-zA-Z][a-zA-Z0-9]*)')
+_VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+_RAW_TEXT_TAGS = ('script', 'style')
+
+
+def parse_document(page: str) -> 'HtmlElement':
+    """
+    Full lxml document, lxml is imported on first use.
+    """
+    from lxml.html import document_fromstring
+    return document_fromstring(page)
+
+
+def _tag_attributes(page: str, start: int) -> Optional[Tuple[int, Dict[str, str]]]:
+    """
+    Position after the tag opened at page[start] and its attributes,
+    None if it is not a well formed tag.
+    """
+    match = _TAG_NAME.match(page, start)
+    if match is None:
+        return None
+    position = match.end()
+    attributes: Dict[str, str] = {}
+    while True:
+        attribute = _ATTRIBUTE.match(page, position)
+        if attribute is None or attribute.end() == position:
+            break
+        name, double, single, bare = attribute.groups()
+        value = double if double is not None else single if single is not None else bare
+        attributes.setdefault(name.lower(), unescape(value or ''))
+        position = attribute.end()
+    closing = page.find('>', position)
+    if closing == -1 or page[position:closing].strip() not in ('', '/'):
+        return None
+    attributes[''] = match.group(1).lower()
+    return closing + 1, attributes
+
+
+def _in_text(page: str, start: int) -> bool:
+    """
+    Whether page[start] is inside a comment or content of script or style,
+    where lxml does not see tags.
+    """
+    comment = page.rfind('<!--', 0, start)
+    if comment != -1 and page.find('-->', comment + 4, start) == -1:
+        return True
+    for tag in _RAW_TEXT_TAGS:
+        opened = page.rfind(f'<{tag}', 0, start)
+        if opened != -1 and page.find(f'</{tag}', opened, start) == -1:
+            return True
+    return False
+
+
+def _find_tag(
+    page: str,
+    attribute: str,
+    value: str,
+    tag: Optional[str] = None,
+) -> Optional[Tuple[int, Dict[str, str]]]:
+    """
+    First tag whose attribute has exactly this value, tags in comments and scripts are skipped.
+    """
+    needle = f'{attribute}="{value}"'
+    position = page.find(needle)
+    while position != -1:
+        start = page.rfind('<', 0, position)
+        if start != -1 and not _in_text(page, start):
+            found = _tag_attributes(page, start)
+            if found is not None and found[1].get(attribute) == value:
+                if tag is None or found[1][''] == tag:
+                    return found
+        position = page.find(needle, position + len(needle))
+    return None
+
+
+def attribute_by_id(page: str, element_id: str, attribute: str) -> str:
+    found = _find_tag(page, 'id', element_id)
+    if found is not None and attribute in found[1]:
+        return found[1][attribute]
+    document = parse_document(page)
+    return document.get_element_by_id(element_id).attrib[attribute]
+
+
+def input_value(page: str, name: str) -> str:
+    found = _find_tag(page, 'name', name, tag='input')
+    if found is not None and 'value' in found[1]:
+        return found[1]['value']
+    document = parse_document(page)
+    return document.cssselect(f'input[name="{name}"]')[0].attrib['value']
+
+
+def _child_text(page: str, parent_id: str, tag: str, position: int) -> Optional[str]:
+    parent = _find_tag(page, 'id', parent_id)
+    if parent is None:
+        return None
+    cursor = parent[0]
+    for index in range(1, position + 1):
+        start = page.find('<', cursor)
+        child = _tag_attributes(page, start) if start != -1 else None
+        if child is None:
+            return None
+        opened, attributes = child
+        name = attributes['']
+        if index == position:
+            if name != tag:
+                return None
+            end = page.find('<', opened)
+            return unescape(page[opened:end]) if end != -1 else None
+        if name in _VOID_TAGS:
+            return None
+        closing = page.find(f'</{name}', opened)
+        if closing == -1 or page.find(f'<{name}', opened, closing) != -1:
+            return None
+        cursor = page.find('>', closing) + 1
+    return None
+
+
+def child_text(page: str, parent_id: str, tag: str, position: int) -> str:
+    """
+    Text of `#parent_id > tag:nth-child(position)`.
+    """
+    text = _child_text(page, parent_id, tag, position)
+    if text is not None:
+        return text
+    document = parse_document(page)
+    return document.cssselect(f'#{parent_id} > {tag}:nth-child({position})')[0].text
@@ -0,0 +1,130 @@
+import asyncio
+import re
+import time
+from typing import Dict, List, Optional
+
+from yarl import URL
+
+
+class Pacer:
+    """
+    Keeps at least delay seconds between starts of two operations.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        if self.delay <= 0:
+            return
+        now = time.monotonic()
+        start = max(now, self._next)
+        self._next = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class EndpointLimit:
+
+    def __init__(self, name: str, pattern: str, rate: float, burst: int = 1):
+        """
+        :param pattern: Regular expression matched against host and path, e.g. "steamcommunity.com/market/".
+        :param rate: Requests per second.
+        :param burst: Requests allowed at once after idle time.
+        """
+        self.name = name
+        self.pattern = re.compile(pattern)
+        self.rate = rate
+        self.burst = burst
+
+
+class TokenBucket:
+    """
+    Token bucket with additive increase and multiplicative decrease of the rate.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: Optional[float] = None):
+        self.max_rate = rate
+        self.min_rate = rate / 32 if min_rate is None else min_rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        self.rate = max(self.rate / 2, self.min_rate)
+        self._tokens = min(self._tokens, 0)
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def succeeded(self) -> None:
+        if self.rate < self.max_rate:
+            self.rate = min(self.rate + self.max_rate / 20, self.max_rate)
+
+
+class RateLimiter:
+    """
+    Shared per-endpoint budgets for all requests of one transport.
+    Requests to endpoints without limit are not delayed.
+    """
+
+    default_limits = [
+        EndpointLimit('pricehistory', r'^steamcommunity\.com/market/pricehistory', rate=20 / 60, burst=4),
+        EndpointLimit('inventory', r'^steamcommunity\.com/(profiles/\d+/)?inventory/', rate=15 / 60, burst=3),
+        EndpointLimit('send_offer', r'^steamcommunity\.com/tradeoffer/new/send', rate=1, burst=2),
+    ]
+    throttle_statuses = (429, 503)
+
+    def __init__(self, limits: Optional[List[EndpointLimit]] = None):
+        self.limits = self.default_limits if limits is None else limits
+        self._buckets: Dict[str, TokenBucket] = {
+            limit.name: TokenBucket(limit.rate, limit.burst) for limit in self.limits
+        }
+
+    def bucket(self, url: str) -> Optional[TokenBucket]:
+        parsed = URL(url)
+        endpoint = f'{parsed.host}{parsed.path}'
+        for limit in self.limits:
+            if limit.pattern.search(endpoint):
+                return self._buckets[limit.name]
+        return None
+
+    async def acquire(self, url: str) -> None:
+        bucket = self.bucket(url)
+        if bucket is not None:
+            await bucket.acquire()
+
+    def feedback(self, url: str, status: int, retry_after: Optional[str] = None) -> None:
+        bucket = self.bucket(url)
+        if bucket is None:
+            return
+        if status in self.throttle_statuses:
+            delay: Optional[float] = None
+            if retry_after is not None:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    delay = None
+            bucket.throttled(delay)
+        elif status < 400:
+            bucket.succeeded()
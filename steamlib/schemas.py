@@ -1,10 +1,88 @@
-from typing import Dict, Optional
+from enum import Enum
+from inspect import isclass
+from typing import Any, ClassVar, Dict, Optional, Type, TypeVar
 
-from pydantic import BaseModel, root_validator
+from pydantic import BaseModel, ValidationError, root_validator
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import DictError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
 from pysteamauth.errors import check_steam_error
 
+from steamlib import codec
 
-class BaseSteamResponse(BaseModel):
+Model = TypeVar('Model', bound=BaseModel)
+
+
+def _construct_value(field: ModelField, value: Any) -> Any:
+    if value is None or not isclass(field.type_):
+        return value
+    if issubclass(field.type_, BaseModel):
+        if field.shape == SHAPE_SINGLETON:
+            return construct(field.type_, value)
+        if field.shape == SHAPE_LIST:
+            return [construct(field.type_, item) for item in value]
+    elif field.shape != SHAPE_SINGLETON:
+        return value
+    elif issubclass(field.type_, Enum):
+        return field.type_(value)
+    elif field.type_ in (int, float) and not isinstance(value, field.type_):
+        return field.type_(value)
+    return value
+
+
+def construct(model: Type[Model], obj: Any) -> Model:
+    """
+    Build model from trusted data without field validation.
+    Nested models, enums and numbers given as strings are converted,
+    fields with own validators and root validators still run.
+    """
+    if model.__custom_root_type__ and not (isinstance(obj, dict) and obj.keys() == {'__root__'}):
+        obj = {'__root__': obj}
+    if not isinstance(obj, dict):
+        raise ValidationError([ErrorWrapper(DictError(), loc='__root__')], model)
+    for pre_validator in model.__pre_root_validators__:
+        obj = pre_validator(model, obj)
+    values: Dict[str, Any] = {}
+    for name, field in model.__fields__.items():
+        if field.alias in obj:
+            value = obj[field.alias]
+        elif name in obj and model.__config__.allow_population_by_field_name:
+            value = obj[name]
+        else:
+            continue
+        if field.class_validators:
+            value, errors = field.validate(value, values, loc=field.alias, cls=model)  # type:ignore
+            if errors:
+                raise ValidationError([errors], model)
+        else:
+            value = _construct_value(field, value)
+        values[name] = value
+    fields_set = set(values)
+    for _, post_validator in model.__post_root_validators__:
+        values = post_validator(model, values)
+    return model.construct(fields_set, **values)
+
+
+class SteamModel(BaseModel):
+    """
+    Set trusted to True on a response class, or on SteamModel for all of them,
+    to build responses with construct instead of full validation.
+    """
+
+    trusted: ClassVar[bool] = False
+
+    class Config:
+        json_loads = codec.loads
+        json_dumps = codec.dumps
+
+    @classmethod
+    def parse_obj(cls: Type[Model], obj: Any) -> Model:
+        if cls.trusted:  # type:ignore
+            return construct(cls, obj)
+        return super().parse_obj(obj)  # type:ignore
+
+
+class BaseSteamResponse(SteamModel):
     success: int
     errmsg: Optional[str]
 
@@ -0,0 +1,44 @@
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+Method = TypeVar('Method', bound=Callable[..., Awaitable[Any]])
+
+
+class SingleFlight:
+    """
+    Runs one call per key at a time, callers with the same key wait for the same result.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(future)
+
+
+def coalesce(method: Method) -> Method:
+    """
+    Coalesce identical calls of read method while one of them is in flight.
+    Works only when single_flight attribute of the object is set, result is shared between callers.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        flight = self.single_flight
+        if flight is None:
+            return await method(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__qualname__, id(self), *list(bound.arguments.values())[1:])
+        return await flight.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper  # type:ignore
@@ -0,0 +1,130 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiohttp
+from aiohttp import ClientResponse, ClientResponseError, ClientSession
+from multidict import CIMultiDict
+from pysteamauth.base import BaseRequestStrategy
+from pysteamauth.errors import check_steam_error
+from yarl import URL
+
+from steamlib.ratelimit import RateLimiter
+
+
+class SteamTransport(BaseRequestStrategy):
+    """
+    Request strategy with one reused connection pool.
+
+    Pass the same object to Steam(request_strategy=...) and SteamAPI(transport=...),
+    SteamAPI closes it on exit from `async with`.
+    """
+
+    default_limits_per_host = {
+        'steamcommunity.com': 20,
+        'store.steampowered.com': 6,
+        'api.steampowered.com': 10,
+    }
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limits_per_host: Optional[Dict[str, int]] = None,
+        keepalive_timeout: float = 60,
+        ttl_dns_cache: int = 300,
+        rate_limiter: Optional[RateLimiter] = None,
+        retries: int = 2,
+    ):
+        """
+        :param limit: Maximum number of open connections.
+        :param limits_per_host: Maximum number of simultaneous requests to each host,
+            hosts missing here are limited only by limit.
+        :param rate_limiter: Per-endpoint request budgets, RateLimiter() with default limits if not specified.
+        :param retries: How many times GET request is repeated after 429 or 503 response.
+        """
+        super().__init__()
+        self._session: Optional[ClientSession] = None
+        self.limit = limit
+        self.limits_per_host = self.default_limits_per_host if limits_per_host is None else limits_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.rate_limiter = RateLimiter() if rate_limiter is None else rate_limiter
+        self.retries = retries
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _create_session(self) -> ClientSession:
+        return ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.limit,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+            ),
+        )
+
+    @asynccontextmanager
+    async def _slot(self, url: str) -> AsyncIterator[None]:
+        host = URL(url).host or ''
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            if host not in self.limits_per_host:
+                yield
+                return
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.limits_per_host[host])
+        async with semaphore:
+            yield
+
+    def _retry(self, method: str, attempt: int, status: int) -> bool:
+        return method == 'GET' and attempt < self.retries and status in self.rate_limiter.throttle_statuses
+
+    @asynccontextmanager
+    async def _response(self, url: str, method: str, **kwargs: Any) -> AsyncIterator[ClientResponse]:
+        """
+        Response of the request, the host slot is held until the block exits.
+        Rate limit token is taken before the slot, so requests waiting for a token do not hold connections.
+        """
+        if self._session is None:
+            self._session = self._create_session()
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire(url)
+            async with self._slot(url):
+                try:
+                    response = await self._session.request(method, url, **kwargs)
+                except ClientResponseError as response_error:
+                    headers = CIMultiDict(response_error.headers or ())
+                    self.rate_limiter.feedback(url, response_error.status, headers.get('Retry-After'))
+                    if not self._retry(method, attempt, response_error.status):
+                        raise
+                    attempt += 1
+                    continue
+                self.rate_limiter.feedback(url, response.status, response.headers.get('Retry-After'))
+                if self._retry(method, attempt, response.status):
+                    response.release()
+                    attempt += 1
+                    continue
+                error = response.headers.get('X-eresult')
+                if error:
+                    try:
+                        check_steam_error(int(error))
+                    except Exception:
+                        response.release()
+                        raise
+                yield response
+                return
+
+    async def request(self, url: str, method: str, **kwargs: Any) -> ClientResponse:
+        async with self._response(url, method, **kwargs) as response:
+            return response
+
+    async def text(self, url: str, method: str, **kwargs: Any) -> str:
+        async with self._response(url, method, **kwargs) as response:
+            return await response.text()
+
+    async def bytes(self, url: str, method: str, **kwargs: Any) -> bytes:
+        async with self._response(url, method, **kwargs) as response:
+            return await response.read()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
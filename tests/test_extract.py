@@ -0,0 +1,116 @@
+from html import escape
+from typing import Callable, Dict
+
+import pytest
+from lxml.html import document_fromstring
+
+from steamlib import extract
+
+FILLER = ''.join(
+    f'<div class="menu_item" data-tooltip-html="Menu &quot;{number}&quot;">'
+    f'<a href="https://steamcommunity.com/app/{number}/">Section {number}</a></div>\n'
+    for number in range(500)
+)
+
+TRAPS: Dict[str, Callable[[str], str]] = {
+    'plain': lambda decoy: '',
+    'comment': lambda decoy: f'<!-- {decoy} -->\n',
+    'commented block': lambda decoy: f'<!--\n<div class="old">\n{decoy}\n</div>\n-->\n',
+    'script': lambda decoy: f'<script type="text/javascript">var html = \'{decoy}\';</script>\n',
+    'style': lambda decoy: f'<style>/* {decoy} */ .a {{ color: red; }}</style>\n',
+    # lxml parses tags inside textarea, the decoy is expected to be found there
+    'textarea': lambda decoy: f'<textarea name="summary">{decoy}</textarea>\n',
+}
+HIDDEN = [trap for trap in TRAPS if trap != 'textarea']
+
+
+def page(body: str, trap: str) -> str:
+    return f'<!DOCTYPE html>\n<html><head><title>Steam</title></head><body>\n{FILLER}{trap}{body}{FILLER}</body></html>'
+
+
+def profile_edit_page(trap: str) -> str:
+    config = escape('{"strPersonaName": "persona & \\"name\\"", "Privacy": {"eCommentPermission": 1}}')
+    decoy = '<div id="profile_edit_config" data-profile-edit="{}"></div>'
+    return page(
+        f'<div class="profile_edit_config" id="profile_edit_config" data-profile-edit="{config}"></div>\n',
+        TRAPS[trap](decoy),
+    )
+
+
+def tradelink_page(trap: str) -> str:
+    decoy = '<input id="trade_offer_access_url" value="https://steamcommunity.com/tradeoffer/new/?partner=1&token=x">'
+    return page(
+        '<div class="trade_offer_access_url_ctn"><input class="trade_offer_access_url" id="trade_offer_access_url" '
+        'value="https://steamcommunity.com/tradeoffer/new/?partner=39734272&amp;token=AbCdEf12" readonly></div>\n',
+        TRAPS[trap](decoy),
+    )
+
+
+def store_page(trap: str) -> str:
+    decoy = '<input type="hidden" name="snr" value="decoy"><input type="hidden" name="subid" value="1">'
+    form = (
+        '<form name="add_to_cart_{subid}" action="https://store.steampowered.com/cart/" method="POST">\n'
+        '<input type="hidden" name="snr" value="1_5_9__403">\n'
+        '<input type="hidden" name="originating_snr" value="1_store-navigation__">\n'
+        "<input type='hidden' name='action' value='add_to_cart'>\n"
+        '<input type="hidden" name="subid" value="{subid}">\n'
+        '</form>\n'
+    )
+    return page(''.join(form.format(subid=subid) for subid in (469, 54029)), TRAPS[trap](decoy))
+
+
+def api_key_page(trap: str) -> str:
+    decoy = '<div id="bodyContents_ex"><h2>Key</h2><p>Key: DECOY</p></div>'
+    return page(
+        '<div id="bodyContents_ex">\n<h2>Your Steam Web API Key</h2>\n'
+        '<p>Key: 0123456789ABCDEF0123456789ABCDEF</p>\n<p>Domain Name: example.com</p>\n</div>\n',
+        TRAPS[trap](decoy),
+    )
+
+
+@pytest.mark.parametrize('trap', TRAPS)
+def test_profile_edit_config(trap: str) -> None:
+    html = profile_edit_page(trap)
+    expected = document_fromstring(html).get_element_by_id('profile_edit_config').attrib['data-profile-edit']
+    assert extract.attribute_by_id(html, 'profile_edit_config', 'data-profile-edit') == expected
+
+
+@pytest.mark.parametrize('trap', TRAPS)
+def test_tradelink(trap: str) -> None:
+    html = tradelink_page(trap)
+    expected = document_fromstring(html).get_element_by_id('trade_offer_access_url').attrib['value']
+    assert extract.attribute_by_id(html, 'trade_offer_access_url', 'value') == expected
+    assert expected.endswith('token=AbCdEf12') or trap not in HIDDEN
+
+
+@pytest.mark.parametrize('trap', TRAPS)
+@pytest.mark.parametrize('name', ['snr', 'originating_snr', 'action', 'subid'])
+def test_store_cart_fields(trap: str, name: str) -> None:
+    html = store_page(trap)
+    expected = document_fromstring(html).cssselect(f'input[name="{name}"]')[0].attrib['value']
+    assert extract.input_value(html, name) == expected
+
+
+@pytest.mark.parametrize('trap', TRAPS)
+def test_api_key(trap: str) -> None:
+    html = api_key_page(trap)
+    expected = document_fromstring(html).cssselect('#bodyContents_ex > p:nth-child(2)')[0].text
+    assert extract.child_text(html, 'bodyContents_ex', 'p', 2) == expected
+    assert expected == 'Key: 0123456789ABCDEF0123456789ABCDEF' or trap not in HIDDEN
+
+
+@pytest.mark.parametrize('trap', ['plain', 'comment', 'script'])
+def test_fast_path_is_used(trap: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(page: str) -> None:  # noqa:U100
+        raise AssertionError('lxml fallback was used')
+
+    monkeypatch.setattr(extract, 'parse_document', fail)
+    extract.attribute_by_id(tradelink_page(trap), 'trade_offer_access_url', 'value')
+    extract.input_value(store_page(trap), 'subid')
+    extract.child_text(api_key_page(trap), 'bodyContents_ex', 'p', 2)
+
+
+def test_missing_element_falls_back_to_lxml() -> None:
+    html = page('<input id="other" value="x">', '')
+    with pytest.raises(KeyError):
+        extract.attribute_by_id(html, 'trade_offer_access_url', 'value')
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Any, Dict, List
+
+from steamlib import codec
+from steamlib.api.trade import SendOfferRequest, SteamTrade
+from steamlib.singleflight import SingleFlight
+
+TRADELINK = 'https://steamcommunity.com/tradeoffer/new/?partner=39734272&token=AbCdEf12'
+
+
+class FakeSteam:
+    """
+    Steam creating a trade offer waiting for mobile confirmation on every send.
+    """
+
+    steamid = 76561198000000000
+    partner_id = 39734272
+    device_id = 'android:00000000-0000-0000-0000-000000000000'
+
+    def __init__(self) -> None:
+        self.offers: List[int] = []
+
+    async def request(self, url: str, method: str = 'GET', **kwargs: Any) -> str:  # noqa:U100
+        await asyncio.sleep(0.001)
+        if url.endswith('/tradeoffer/new/send'):
+            self.offers.append(len(self.offers) + 1)
+            return codec.dumps({'tradeofferid': str(self.offers[-1]), 'needs_mobile_confirmation': True})
+        if url.endswith('/mobileconf/getlist'):
+            offers = self.offers[:]
+            await asyncio.sleep(0.01)
+            return codec.dumps({'success': True, 'conf': [self.confirmation(offer) for offer in offers]})
+        if url.endswith('/mobileconf/multiajaxop'):
+            return codec.dumps({'success': True})
+        raise LookupError(url)
+
+    async def sessionid(self, domain: str = 'steamcommunity.com') -> str:  # noqa:U100
+        return '0123456789abcdef01234567'
+
+    async def get_server_time(self) -> int:
+        return 1700000000
+
+    def get_confirmation_hash(self, server_time: int, tag: str = 'conf') -> str:
+        return f'{server_time}{tag}'
+
+    @staticmethod
+    def confirmation(offer: int) -> Dict[str, Any]:
+        return {
+            'type': 2,
+            'type_name': 'Trade Offer',
+            'id': str(100 + offer),
+            'creator_id': str(offer),
+            'nonce': str(900 + offer),
+            'creation_time': 1700000000,
+            'cancel': 'Cancel',
+            'accept': 'Send Offer',
+            'icon': '',
+            'multi': False,
+        }
+
+
+def test_send_offers_confirms_every_offer_with_single_flight() -> None:
+    steam = FakeSteam()
+    trade = SteamTrade(steam, single_flight=SingleFlight())  # type:ignore
+    requests = [SendOfferRequest(partner=39734272, tradelink=TRADELINK, me=[], them=[]) for _ in range(20)]
+
+    async def send() -> List[Any]:
+        return [result async for result in trade.send_offers(requests, limit=4, confirm_batch=5)]
+
+    results = asyncio.run(send())
+    assert len(results) == 20
+    assert all(result.confirmed for result in results)